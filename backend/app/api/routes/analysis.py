@@ -1,26 +1,41 @@
 """
 Risk analysis API routes
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from time import time
+from typing import Callable
+from dataclasses import asdict
+from functools import lru_cache
+import asyncio
+import logging
+import orjson
 
-from app.models.trademark import SearchQuery
+from app.config import settings
+from app.models.trademark import SearchQuery, Trademark
 from app.models.risk import (
     AnalysisResponse,
     TrademarkRiskAnalysis,
+    RiskFactors,
     RiskTierResults,
     SearchResultsSummary,
     RiskLevel
 )
-from app.services.db_client import PostgreSQLClient
 from app.services.risk_scorer import RiskScorer
 from app.services.ai_analyzer import AIAnalyzer
+from app.services.scorer_cache import ScorerCache
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Stateless services shared across requests
+risk_scorer = RiskScorer()
+ai_analyzer = AIAnalyzer()
+
 
-@router.post("/analyze", response_model=AnalysisResponse)
-async def analyze_trademark(query: SearchQuery):
+@router.post("/analyze", response_model=AnalysisResponse, response_class=ORJSONResponse)
+async def analyze_trademark(query: SearchQuery, request: Request):
     """
     Comprehensive trademark risk analysis
 
@@ -39,92 +54,24 @@ async def analyze_trademark(query: SearchQuery):
     start_time = time()
 
     try:
-        # Step 1: Search PostgreSQL database
-        db_client = PostgreSQLClient()
-        db_client.connect()
-        trademarks = db_client.search_trademarks(
-            query=query.query,
-            limit=query.limit
-        )
+        risk_analyses, results_by_tier = await _score_and_tier(query, request)
 
-        if not trademarks:
+        if not risk_analyses:
             # No results found - return empty response instead of 404
             processing_time = time() - start_time
             return AnalysisResponse(
                 query=query.query,
-                summary=SearchResultsSummary(
-                    query=query.query,
-                    total_results=0,
-                    overall_risk_level=RiskLevel.LOW,
-                    risk_distribution={"critical": 0, "high": 0, "medium": 0, "low": 0},
-                    key_findings=[],
-                    recommendations=[
-                        "No existing trademarks found matching your search",
-                        "This is a positive sign for trademark clearance",
-                        "Consider conducting a comprehensive trademark search through an attorney"
-                    ],
-                    summary="No trademarks were found matching your search query in the USPTO database. While this is encouraging, it's recommended to conduct a comprehensive trademark search before proceeding.",
-                    suggested_next_steps=[
-                        "Consult with a trademark attorney for comprehensive clearance",
-                        "Consider searching for phonetically similar marks",
-                        "Evaluate potential common law trademark conflicts"
-                    ]
-                ),
-                results_by_tier=RiskTierResults(),
+                summary=_no_results_summary(query.query),
+                results_by_tier=results_by_tier,
                 total_analyzed=0,
                 processing_time_seconds=round(processing_time, 2)
             )
 
-        # Step 2: Calculate risk scores
-        risk_scorer = RiskScorer()
-        risk_analyses = []
-
-        for trademark in trademarks:
-            risk_score, risk_factors = risk_scorer.calculate_risk_score(
-                query=query.query,
-                trademark=trademark,
-                query_classes=query.classes or []
-            )
-
-            risk_level = risk_scorer.get_risk_level(risk_score)
-            conflict_reason = risk_scorer.get_conflict_reason(
-                query=query.query,
-                trademark=trademark,
-                risk_factors=risk_factors
-            )
-
-            risk_analysis = TrademarkRiskAnalysis(
-                serial_number=trademark.serial_number,
-                mark_text=trademark.mark_text,
-                owner_name=trademark.owner_name,
-                risk_score=risk_score,
-                risk_level=risk_level,
-                risk_factors=risk_factors,
-                risk_explanation=conflict_reason,
-                conflict_reason=conflict_reason,
-                recommendations=_generate_recommendations(risk_level, trademark),
-                goods_services_description=trademark.goods_services_description,
-                international_classes=trademark.international_classes,
-                status=trademark.status.value if trademark.status else None,
-                filing_date=trademark.filing_date.isoformat() if trademark.filing_date else None,
-                registration_date=trademark.registration_date.isoformat() if trademark.registration_date else None
-            )
-
-            risk_analyses.append(risk_analysis)
-
-        # Step 3: Organize by risk tier
-        results_by_tier = RiskTierResults(
-            critical=[r for r in risk_analyses if r.risk_level.value == "critical"],
-            high=[r for r in risk_analyses if r.risk_level.value == "high"],
-            medium=[r for r in risk_analyses if r.risk_level.value == "medium"],
-            low=[r for r in risk_analyses if r.risk_level.value == "low"]
-        )
-
         # Step 4: Generate AI summary
-        ai_analyzer = AIAnalyzer()
         summary = await ai_analyzer.generate_summary(
             query=query.query,
-            risk_analyses=risk_analyses
+            risk_analyses=risk_analyses,
+            cache=request.app.state.summary_cache
         )
 
         processing_time = time() - start_time
@@ -146,29 +93,261 @@ async def analyze_trademark(query: SearchQuery):
         )
 
 
-def _generate_recommendations(risk_level, trademark) -> list[str]:
-    """Generate specific recommendations based on risk level"""
+@router.post("/analyze/stream")
+async def analyze_trademark_stream(query: SearchQuery, request: Request):
+    """
+    Streaming variant of /analyze using Server-Sent Events
 
-    if risk_level.value == "critical":
-        return [
-            "Do not proceed without legal consultation",
-            "Consider alternative brand names",
-            f"Review {trademark.owner_name}'s trademark portfolio"
-        ]
-    elif risk_level.value == "high":
-        return [
-            "Consult trademark attorney before proceeding",
-            "Conduct comprehensive clearance search",
-            "Evaluate name modifications or alternatives"
-        ]
-    elif risk_level.value == "medium":
-        return [
-            "Monitor this trademark's status",
-            "Consider filing in different international classes",
-            "Document your independent creation and use"
+    Events, in order:
+    - tiers: {query, results_by_tier, total_analyzed} as soon as scoring is done
+    - summary_json: fragments of the emit_summary tool-input JSON as Claude
+      writes it (each a JSON-encoded string; concatenated they form the
+      tool input, not prose)
+    - error: {detail} if summary generation failed mid-stream
+    - done: {summary, processing_time_seconds} with the parsed summary (the
+      canned fallback summary after an error)
+    """
+    start_time = time()
+
+    try:
+        risk_analyses, results_by_tier = await _score_and_tier(query, request)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error analyzing trademark: {str(e)}"
+        )
+
+    async def events():
+        yield _sse("tiers", {
+            "query": query.query,
+            "results_by_tier": results_by_tier.model_dump(mode="json"),
+            "total_analyzed": len(risk_analyses)
+        })
+
+        summary = None
+        if not risk_analyses:
+            summary = _no_results_summary(query.query)
+        else:
+            try:
+                async for item in ai_analyzer.stream_summary(
+                    query=query.query,
+                    risk_analyses=risk_analyses,
+                    cache=request.app.state.summary_cache
+                ):
+                    if isinstance(item, SearchResultsSummary):
+                        summary = item
+                    else:
+                        yield _sse("summary_json", item)
+            except Exception as e:
+                logger.exception("Error streaming summary for %r", query.query)
+                yield _sse("error", {"detail": f"Error generating summary: {e}"})
+
+            # Always finish with a summary, even if the stream broke off
+            if summary is None:
+                summary = ai_analyzer.fallback_summary(query.query, risk_analyses)
+
+        yield _sse("done", {
+            "summary": summary.model_dump(mode="json"),
+            "processing_time_seconds": round(time() - start_time, 2)
+        })
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _score_and_tier(query: SearchQuery, request: Request) -> tuple[list[TrademarkRiskAnalysis], RiskTierResults]:
+    """Search, optionally enrich, score and tier results (steps 1-3 of /analyze)"""
+    # Step 1: Search PostgreSQL database
+    db_client = request.app.state.db_client
+    trademarks = await db_client.search_trademarks(
+        query=query.query,
+        limit=query.limit
+    )
+
+    if not trademarks:
+        return [], RiskTierResults()
+
+    # Step 1b: Enrich database records with TSDR details (optional)
+    if settings.ENABLE_TSDR_ENRICHMENT:
+        await _enrich_from_tsdr(request.app.state.uspto_client, trademarks)
+
+    # Step 2: Calculate risk scores (CPU-bound, so keep it off the event loop)
+    risk_analyses = await asyncio.to_thread(
+        _score_all, query, trademarks, request.app.state.scorer_cache
+    )
+
+    # Step 3: Organize by risk tier
+    tiers = {level: [] for level in RiskLevel}
+    for r in risk_analyses:
+        tiers[r.risk_level].append(r)
+
+    results_by_tier = RiskTierResults(
+        critical=tiers[RiskLevel.CRITICAL],
+        high=tiers[RiskLevel.HIGH],
+        medium=tiers[RiskLevel.MEDIUM],
+        low=tiers[RiskLevel.LOW]
+    )
+
+    return risk_analyses, results_by_tier
+
+
+def _no_results_summary(query: str) -> SearchResultsSummary:
+    """Canned summary for a search with no matching trademarks"""
+    return SearchResultsSummary(
+        query=query,
+        total_results=0,
+        overall_risk_level=RiskLevel.LOW,
+        risk_distribution={"critical": 0, "high": 0, "medium": 0, "low": 0},
+        key_findings=[],
+        recommendations=[
+            "No existing trademarks found matching your search",
+            "This is a positive sign for trademark clearance",
+            "Consider conducting a comprehensive trademark search through an attorney"
+        ],
+        summary="No trademarks were found matching your search query in the USPTO database. While this is encouraging, it's recommended to conduct a comprehensive trademark search before proceeding.",
+        suggested_next_steps=[
+            "Consult with a trademark attorney for comprehensive clearance",
+            "Consider searching for phonetically similar marks",
+            "Evaluate potential common law trademark conflicts"
         ]
+    )
+
+
+def _sse(event: str, data) -> bytes:
+    """Format one Server-Sent Event with a JSON payload"""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+def _score_all(query: SearchQuery, trademarks, scorer_cache) -> list[TrademarkRiskAnalysis]:
+    """Score every trademark against the query, reusing cached results where possible"""
+    query_classes = query.classes or []
+    if scorer_cache:
+        cache_keys = [ScorerCache.make_key(query.query, query_classes, t) for t in trademarks]
+        cached_scores = scorer_cache.get_many(cache_keys)
     else:
-        return [
-            "Note this mark for awareness",
-            "Proceed with standard clearance process"
-        ]
+        cache_keys = [None] * len(trademarks)
+        cached_scores = {}
+
+    # Text similarity for every uncached trademark the database search didn't
+    # already score, in one batch
+    uncached = [i for i, key in enumerate(cache_keys) if key not in cached_scores]
+    unmatched = [i for i in uncached if trademarks[i]._similarity_score is None]
+    similarities = dict(zip(
+        unmatched,
+        risk_scorer.batch_similarity(query.query, [trademarks[i].mark_text for i in unmatched])
+    ))
+
+    # Then the weighted risk scores, also in one batch
+    scored = dict(zip(uncached, risk_scorer.score_many(
+        query.query,
+        [trademarks[i] for i in uncached],
+        query_classes,
+        [similarities.get(i) for i in uncached]
+    )))
+
+    new_scores = []
+    risk_scores = []
+    factors_and_reasons = []
+
+    for i, trademark in enumerate(trademarks):
+        cached = cached_scores.get(cache_keys[i])
+        if cached:
+            risk_score, factors, conflict_reason = cached
+            risk_factors = RiskFactors.model_construct(**factors)
+        else:
+            risk_score, compact = scored[i]
+            conflict_reason = risk_scorer.get_conflict_reason(
+                query=query.query,
+                trademark=trademark,
+                risk_factors=compact
+            )
+            risk_factors = compact.to_model()
+            if scorer_cache:
+                new_scores.append(
+                    (cache_keys[i], (risk_score, asdict(compact), conflict_reason))
+                )
+        risk_scores.append(risk_score)
+        factors_and_reasons.append((risk_factors, conflict_reason))
+
+    risk_analyses = []
+    for trademark, risk_score, risk_level, (risk_factors, conflict_reason) in zip(
+        trademarks, risk_scores, risk_scorer.get_risk_levels(risk_scores), factors_and_reasons
+    ):
+        # Built from already-validated values, so skip Pydantic validation
+        risk_analysis = TrademarkRiskAnalysis.model_construct(
+            serial_number=trademark.serial_number,
+            mark_text=trademark.mark_text,
+            owner_name=trademark.owner_name,
+            risk_score=risk_score,
+            risk_level=risk_level,
+            risk_factors=risk_factors,
+            risk_explanation=conflict_reason,
+            conflict_reason=conflict_reason,
+            recommendations=_RECOMMENDATIONS[risk_level](trademark),
+            goods_services_description=trademark.goods_services_description,
+            international_classes=trademark.international_classes,
+            status=trademark.status.value if trademark.status else None,
+            filing_date=trademark.filing_date.isoformat() if trademark.filing_date else None,
+            registration_date=trademark.registration_date.isoformat() if trademark.registration_date else None
+        )
+
+        risk_analyses.append(risk_analysis)
+
+    if new_scores:
+        scorer_cache.put_many(new_scores)
+
+    return risk_analyses
+
+
+async def _enrich_from_tsdr(uspto_client, trademarks) -> None:
+    """
+    Fill owner, classes and goods/services from TSDR for each trademark
+
+    All lookups are dispatched concurrently (capped by TSDR_MAX_CONCURRENCY
+    to stay within USPTO rate limits), so the step costs roughly one TSDR
+    round-trip instead of one per trademark. Failed lookups are skipped.
+    """
+    enriched = await uspto_client.hydrate(
+        trademarks,
+        max_concurrency=settings.TSDR_MAX_CONCURRENCY
+    )
+
+    logger.info("Enriched %d/%d trademarks from TSDR", enriched, len(trademarks))
+
+
+# Static recommendations per risk level; only CRITICAL depends on the trademark
+_HIGH_RECOMMENDATIONS = (
+    "Consult trademark attorney before proceeding",
+    "Conduct comprehensive clearance search",
+    "Evaluate name modifications or alternatives"
+)
+_MEDIUM_RECOMMENDATIONS = (
+    "Monitor this trademark's status",
+    "Consider filing in different international classes",
+    "Document your independent creation and use"
+)
+_LOW_RECOMMENDATIONS = (
+    "Note this mark for awareness",
+    "Proceed with standard clearance process"
+)
+
+
+@lru_cache(maxsize=1024)
+def _critical_recommendations(owner_name: str) -> tuple[str, ...]:
+    """CRITICAL recommendations name the owner; memoized since owners repeat across results"""
+    return (
+        "Do not proceed without legal consultation",
+        "Consider alternative brand names",
+        f"Review {owner_name}'s trademark portfolio"
+    )
+
+
+_RECOMMENDATIONS: dict[RiskLevel, Callable[[Trademark], list[str]]] = {
+    RiskLevel.CRITICAL: lambda trademark: list(_critical_recommendations(trademark.owner_name)),
+    RiskLevel.HIGH: lambda _: list(_HIGH_RECOMMENDATIONS),
+    RiskLevel.MEDIUM: lambda _: list(_MEDIUM_RECOMMENDATIONS),
+    RiskLevel.LOW: lambda _: list(_LOW_RECOMMENDATIONS),
+}
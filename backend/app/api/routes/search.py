@@ -1,17 +1,17 @@
 """
 Search API routes
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from typing import List
 
 from app.models.trademark import SearchQuery, Trademark
-from app.services.db_client import PostgreSQLClient
+from app.api.routes.trademark import get_trademark_details
 
 router = APIRouter()
 
 
 @router.post("/", response_model=List[Trademark])
-async def search_trademarks(query: SearchQuery):
+async def search_trademarks(query: SearchQuery, request: Request):
     """
     Search USPTO trademark database
 
@@ -22,9 +22,8 @@ async def search_trademarks(query: SearchQuery):
         List of matching trademarks
     """
     try:
-        client = PostgreSQLClient()
-        client.connect()
-        results = client.search_trademarks(
+        client = request.app.state.db_client
+        results = await client.search_trademarks(
             query=query.query,
             limit=query.limit
         )
@@ -41,34 +40,5 @@ async def search_trademarks(query: SearchQuery):
         )
 
 
-@router.get("/{serial_number}", response_model=Trademark)
-async def get_trademark(serial_number: str):
-    """
-    Get detailed trademark information by serial number
-
-    Args:
-        serial_number: USPTO serial number
-
-    Returns:
-        Trademark details
-    """
-    try:
-        client = PostgreSQLClient()
-        client.connect()
-        trademark = client.get_trademark_by_serial(serial_number)
-
-        if not trademark:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Trademark {serial_number} not found"
-            )
-
-        return trademark
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error retrieving trademark: {str(e)}"
-        )
+# Same handler as /trademark/{serial_number} (kept for existing API clients)
+router.get("/{serial_number}", response_model=Trademark)(get_trademark_details)
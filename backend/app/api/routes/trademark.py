@@ -1,19 +1,34 @@
 """
 Trademark detail API routes
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+from typing import Optional
+
+from app.config import settings
 from app.models.trademark import Trademark
-from app.services.db_client import PostgreSQLClient
 
 router = APIRouter()
 
 
+async def _fetch_from_db(request: Request, serial_number: str) -> Optional[Trademark]:
+    return await request.app.state.db_client.get_trademark_by_serial(serial_number)
+
+
+async def _fetch_from_tsdr(request: Request, serial_number: str) -> Optional[Trademark]:
+    return await request.app.state.uspto_client.get_trademark_by_serial(serial_number)
+
+
+# Detail source is fixed per deployment, so pick the fetcher once at import
+_fetch_trademark = _fetch_from_tsdr if settings.TRADEMARK_DETAIL_SOURCE == "tsdr" else _fetch_from_db
+
+
 @router.get("/{serial_number}", response_model=Trademark)
-async def get_trademark_details(serial_number: str):
+async def get_trademark_details(serial_number: str, request: Request):
     """
     Get complete trademark details by serial number
 
-    Fetches full trademark information from PostgreSQL database including:
+    Fetches full trademark information from PostgreSQL (or TSDR when
+    TRADEMARK_DETAIL_SOURCE="tsdr") including:
     - Owner name
     - Status and dates
     - International classes
@@ -31,10 +46,22 @@ async def get_trademark_details(serial_number: str):
         404: Trademark not found
         500: Error fetching trademark data
     """
+    cache = request.app.state.trademark_cache
+    if cache:
+        cached = await cache.get(serial_number)
+        if cached == cache.NOT_FOUND:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Trademark with serial number {serial_number} not found"
+            )
+        if cached:
+            return Response(content=cached, media_type="application/json")
+
     try:
-        db_client = PostgreSQLClient()
-        db_client.connect()
-        trademark = db_client.get_trademark_by_serial(serial_number)
+        trademark = await _fetch_trademark(request, serial_number)
+
+        if cache:
+            await cache.set(serial_number, trademark)
 
         if not trademark:
             raise HTTPException(
@@ -2,7 +2,7 @@
 Configuration management for USPTO Trademark Risk Analyzer
 """
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Literal
 
 
 class Settings(BaseSettings):
@@ -18,10 +18,19 @@ class Settings(BaseSettings):
 
     # Database (Railway PostgreSQL) - PRIMARY DATA SOURCE
     DATABASE_URL: str
+    ENABLE_TRIGRAM_SEARCH: bool = False  # requires migrations/001_trigram_search.sql
+    ENABLE_DB_SIMILARITY: bool = False  # requires migrations/003_db_similarity.sql
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 16
+    DB_LOOKUP_CACHE_SIZE: int = 4096  # exact-match / count results kept in memory
+    DB_LOOKUP_CACHE_TTL_SECONDS: int = 60  # 0 disables (search cache too)
+    DB_SEARCH_CACHE_SIZE: int = 256  # search result sets kept in memory
+    DB_STATEMENT_TIMEOUT_MS: int = 5000  # 0 disables
 
     # Application
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
+    LOG_LEVEL: str = "INFO"
     API_V1_PREFIX: str = "/api/v1"
 
     # CORS
@@ -38,6 +47,30 @@ class Settings(BaseSettings):
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
 
+    # Source for GET /trademark/{serial_number} and /search/{serial_number}
+    TRADEMARK_DETAIL_SOURCE: Literal["db", "tsdr"] = "db"
+
+    # TSDR enrichment (fills owner/classes/goods from TSDR during analysis)
+    ENABLE_TSDR_ENRICHMENT: bool = False
+    TSDR_MAX_CONCURRENCY: int = 10
+    TSDR_CACHE_SIZE: int = 4096  # TSDR lookups kept in memory per worker
+    TSDR_CACHE_TTL_SECONDS: int = 3600  # 0 disables
+
+    # Risk score cache (SQLite)
+    SCORER_CACHE_ENABLED: bool = True
+    SCORER_CACHE_PATH: str = "scorer_cache.db"
+    SCORER_CACHE_TTL_SECONDS: int = 86400
+
+    # AI summary cache (SQLite)
+    SUMMARY_CACHE_ENABLED: bool = True
+    SUMMARY_CACHE_PATH: str = "summary_cache.db"
+    SUMMARY_CACHE_TTL_SECONDS: int = 86400
+
+    # Trademark detail cache (Redis, disabled when REDIS_URL is unset)
+    REDIS_URL: str | None = None
+    TRADEMARK_CACHE_TTL_SECONDS: int = 86400
+    TRADEMARK_CACHE_NEGATIVE_TTL_SECONDS: int = 60
+
     # AI Analysis
     CLAUDE_MODEL: str = "claude-sonnet-4-5-20250929"
     MAX_RESULTS_TO_ANALYZE: int = 50
@@ -3,9 +3,21 @@ USPTO Trademark Risk Analyzer - FastAPI Application
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+import logging
 
 from app.config import settings
 from app.api.routes import search, analysis, trademark
+from app.services.db_client import PostgreSQLClient, AsyncPostgreSQLClient
+from app.services.uspto import USPTOClient
+from app.services.scorer_cache import ScorerCache
+from app.services.summary_cache import SummaryCache
+from app.services.trademark_cache import TrademarkCache, HAS_REDIS
+
+# Service modules log through the standard logging module; uvicorn only
+# configures its own loggers
+logging.basicConfig(level=settings.LOG_LEVEL, format="%(levelname)s:     %(name)s - %(message)s")
+logging.getLogger("httpx").setLevel(logging.WARNING)  # one INFO line per request otherwise
 
 # Create FastAPI app
 app = FastAPI(
@@ -13,7 +25,8 @@ app = FastAPI(
     description="AI-powered trademark conflict analysis using USPTO data",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -43,6 +56,55 @@ app.include_router(
 )
 
 
+@app.on_event("startup")
+async def startup():
+    """Create shared clients so connections are reused across requests"""
+    app.state.db_client = AsyncPostgreSQLClient(PostgreSQLClient(
+        trigram_search=settings.ENABLE_TRIGRAM_SEARCH,
+        db_similarity=settings.ENABLE_DB_SIMILARITY,
+        min_connections=settings.DB_POOL_MIN_SIZE,
+        max_connections=settings.DB_POOL_MAX_SIZE,
+        lookup_cache_size=settings.DB_LOOKUP_CACHE_SIZE,
+        lookup_cache_ttl_seconds=settings.DB_LOOKUP_CACHE_TTL_SECONDS,
+        search_cache_size=settings.DB_SEARCH_CACHE_SIZE,
+        statement_timeout_ms=settings.DB_STATEMENT_TIMEOUT_MS
+    ))
+    app.state.uspto_client = USPTOClient(
+        cache_size=settings.TSDR_CACHE_SIZE,
+        cache_ttl_seconds=settings.TSDR_CACHE_TTL_SECONDS
+    )
+    app.state.scorer_cache = (
+        ScorerCache(settings.SCORER_CACHE_PATH, settings.SCORER_CACHE_TTL_SECONDS)
+        if settings.SCORER_CACHE_ENABLED else None
+    )
+    app.state.summary_cache = (
+        SummaryCache(settings.SUMMARY_CACHE_PATH, settings.SUMMARY_CACHE_TTL_SECONDS)
+        if settings.SUMMARY_CACHE_ENABLED else None
+    )
+    app.state.trademark_cache = (
+        TrademarkCache(
+            settings.REDIS_URL,
+            settings.TRADEMARK_CACHE_TTL_SECONDS,
+            settings.TRADEMARK_CACHE_NEGATIVE_TTL_SECONDS
+        )
+        if settings.REDIS_URL and HAS_REDIS else None
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Release shared connections"""
+    app.state.db_client.disconnect()
+    await app.state.uspto_client.aclose()
+    await analysis.ai_analyzer.aclose()
+    if app.state.scorer_cache:
+        app.state.scorer_cache.close()
+    if app.state.summary_cache:
+        app.state.summary_cache.close()
+    if app.state.trademark_cache:
+        await app.state.trademark_cache.aclose()
+
+
 @app.get("/")
 async def root():
     """Root endpoint - API status"""
@@ -40,6 +40,10 @@ class Trademark(BaseModel):
     # For image marks
     mark_image_url: Optional[str] = None
 
+    # Similarity to the search query when computed by the database search
+    # (not serialized)
+    _similarity_score: Optional[float] = None
+
     class Config:
         json_schema_extra = {
             "example": {
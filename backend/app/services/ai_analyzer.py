@@ -1,9 +1,13 @@
 """
 AI-powered trademark risk analysis using Claude
 """
-from typing import List
+from typing import AsyncIterator, Dict, List, Optional, Union
+from collections import Counter
 import anthropic
-import json
+import asyncio
+import heapq
+import httpx
+import logging
 
 from app.config import settings
 from app.models.trademark import Trademark
@@ -13,19 +17,197 @@ from app.models.risk import (
     RiskLevel,
     RiskTierResults
 )
+from app.services.summary_cache import SummaryCache
+
+logger = logging.getLogger(__name__)
+
+
+# Shared attorney persona and scoring rubric. Kept byte-identical across calls
+# and sent as a cached system block, so repeat requests skip prefill for it
+# (Anthropic only caches prefixes of 1024+ tokens, hence the full rubric).
+ANALYSIS_RUBRIC = """You are a trademark attorney analyzing USPTO search results for potential conflicts with a proposed mark. Your audience is a founder or marketer, not a lawyer: be direct, professional and action-oriented, and always focus on what the user should do next.
+
+HOW THE RESULTS WERE SCORED
+
+Every existing trademark in the results has been compared against the proposed mark and given a risk score from 0 to 100. The score is a weighted sum of four factors, each also scored 0-100:
+
+1. Similarity (40% of the score). The highest of: normalized Levenshtein edit-distance similarity between the two marks; a phonetic match (the two marks share any Double Metaphone code, primary or alternate), which scores 80; and substring containment (one mark contains the other), which scores 70. Identical marks score 100. A similarity of 80 or more means the marks look or sound very close; 60-79 means they are similar enough that a consumer could plausibly associate them.
+
+2. Class overlap (30%). Overlap between the user's intended Nice international classes and the classes the existing mark is registered in. Any shared class scores 80-100 depending on how many of the user's classes overlap. Marks in different classes score 10-40, higher when the marks themselves are nearly identical. When the user did not specify classes, or the existing record has no class data, the overlap is inferred conservatively from similarity, so a near-identical mark is assumed to be in a related class.
+
+3. Status and strength (20%). Registered marks score 100, pending applications 70, expired marks 30, and abandoned or cancelled marks 20. Unknown status scores 50.
+
+4. Use in commerce (10%). A proxy based on status: registered marks are assumed to be in active use (80), pending applications partially (50), and everything else minimally (20).
+
+Famous marks (household brands such as APPLE, NIKE, COCA-COLA or GOOGLE) that are registered and at least 80% similar are elevated to at least 95 regardless of class, because famous marks receive dilution protection across unrelated goods and services. An existing mark counts as famous when it is a famous mark or contains one as whole words: APPLE CIDER INC contains APPLE, but PINEAPPLE does not. Famous marks shorter than three letters only count when the whole mark matches.
+
+RISK LEVELS
+
+- CRITICAL (90-100): identical or near-identical mark, usually registered in the same or a related class. Proceeding without legal review is likely to invite an opposition, a cease-and-desist letter or a refusal from the examining attorney under Section 2(d) likelihood of confusion.
+- HIGH (70-89): significant conflict. Attorney consultation is strongly advised before filing or investing in the brand.
+- MEDIUM (40-69): potential issues worth researching, such as a similar mark in a different class or a pending application that may or may not register.
+- LOW (0-39): minimal risk; standard clearance is sufficient.
+
+The overall risk for a search is CRITICAL if any result is critical, HIGH if two or more results are high, MEDIUM if at least one result is high or three or more are medium, and LOW otherwise.
+
+RELATED CLASSES
+
+Classes that differ on paper can still conflict when the goods travel through the same channels of trade. Treat these groups as related when judging class overlap:
+- 009 (software, electronics), 038 (telecommunications) and 042 (SaaS, technology services)
+- 025 (clothing, footwear), 018 (bags, leather goods), 014 (jewelry, watches) and 035 (retail store services)
+- 029, 030, 031 and 032 (foods and non-alcoholic beverages), 033 (wine and spirits) and 043 (restaurants, cafes, bars)
+- 003 (cosmetics), 005 (pharmaceuticals, supplements) and 044 (medical and beauty services)
+- 036 (financial services, payments) and 009 (fintech software)
+- 041 (education, entertainment) and 009 or 016 (media, publications)
+
+HOW TO REASON ABOUT THE RESULTS
+
+- Weigh live conflicts (registered or pending) far above abandoned, cancelled or expired marks. Dead marks mostly matter as evidence that others have tried similar names.
+- A similar mark in the same class is much more serious than an identical mark in an unrelated class, unless the mark is famous.
+- Several moderately similar marks owned by different companies suggest a crowded field, where each mark has a narrow scope of protection; say so when you see it.
+- Several similar marks owned by the same company suggest a brand family that its owner is likely to enforce.
+- Missing class or goods/services data means the class overlap score was inferred. Flag that uncertainty rather than treating the inferred score as fact.
+- Never invent trademarks, owners, serial numbers or legal outcomes that are not in the results you were given. If the data is thin, say what additional search would resolve it.
+- Give practical, concrete recommendations (modify the mark, choose different classes, contact the owner about coexistence, commission a full clearance search, consult an attorney) and realistic timelines. Do not give a definitive legal opinion; this is a preliminary screening.
+"""
+
+SUMMARY_SYSTEM_PROMPT = ANALYSIS_RUBRIC + """
+OUTPUT FORMAT
+
+Analyze the search results in the user message and report your analysis by calling the emit_summary tool:
+- summary: 2-3 sentence overview of the trademark landscape and overall risk
+- key_findings: about 3 findings
+- recommendations: about 3 actionable recommendations
+- timeline: estimated timeline for next steps (e.g., '2-4 weeks for initial clearance')
+- next_steps: about 3 specific next steps
+"""
+
+# Forced tool call so the summary comes back as structured input, not prose
+SUMMARY_TOOL = {
+    "name": "emit_summary",
+    "description": "Report the trademark search analysis.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "summary": {"type": "string"},
+            "key_findings": {"type": "array", "items": {"type": "string"}},
+            "recommendations": {"type": "array", "items": {"type": "string"}},
+            "timeline": {"type": "string"},
+            "next_steps": {"type": "array", "items": {"type": "string"}}
+        },
+        "required": ["summary", "key_findings", "recommendations", "next_steps"]
+    }
+}
+
+EXPLANATION_SYSTEM_PROMPT = ANALYSIS_RUBRIC + """
+OUTPUT FORMAT
+
+The user message describes one existing trademark and its risk to the proposed mark. Briefly explain why it poses that level of risk in 1-2 sentences, focusing on the specific conflict issues. Respond with the explanation only.
+"""
+
+# Per-search part of the summary prompt; top risk items are appended after it
+SUMMARY_CONTEXT_HEADER = """SEARCH QUERY: "{query}"
+
+RESULTS OVERVIEW:
+- Total trademarks found: {total}
+- Critical risk: {critical}
+- High risk: {high}
+- Medium risk: {medium}
+- Low risk: {low}
+
+TOP RISK ITEMS:
+"""
+
+# Risk level labels as shown in TOP RISK ITEMS (keys also match plain strings)
+_RISK_LEVEL_LABELS = {level: level.value.upper() for level in RiskLevel}
+
+# Fallback summary text and recommendations per overall risk level ({count}
+# is the number of results at that level)
+_FALLBACK_SUMMARIES = {
+    RiskLevel.CRITICAL: (
+        "Found {count} critical conflicts for '{query}'. Immediate legal review recommended.",
+        (
+            "Consult a trademark attorney immediately",
+            "Consider alternative brand names",
+            "Do not proceed without legal clearance"
+        )
+    ),
+    RiskLevel.HIGH: (
+        "Found {count} high-risk conflicts for '{query}'. Professional review strongly advised.",
+        (
+            "Conduct comprehensive trademark search",
+            "Consult with trademark attorney",
+            "Evaluate alternative names or modifications"
+        )
+    ),
+    RiskLevel.MEDIUM: (
+        "Found some potential conflicts for '{query}'. Further analysis recommended.",
+        (
+            "Review similar marks in detail",
+            "Consider filing in different classes",
+            "Consult attorney for risk assessment"
+        )
+    ),
+    RiskLevel.LOW: (
+        "No significant conflicts found for '{query}'. Preliminary clearance looks favorable.",
+        (
+            "Proceed with comprehensive search",
+            "Consider trademark registration",
+            "Monitor for new applications"
+        )
+    ),
+}
+
+
+def _cached_system(prompt: str) -> list:
+    """System block marked as a prompt-cache breakpoint"""
+    return [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
+
+
+def _log_usage(label: str, message) -> None:
+    """Log token usage, including prompt-cache reads/writes"""
+    usage = message.usage
+    logger.info(
+        "Claude %s: %d input, %d cache read, %d cache write, %d output tokens",
+        label,
+        usage.input_tokens,
+        getattr(usage, 'cache_read_input_tokens', 0) or 0,
+        getattr(usage, 'cache_creation_input_tokens', 0) or 0,
+        usage.output_tokens
+    )
 
 
 class AIAnalyzer:
     """AI-powered risk analysis using Claude"""
 
+    # Bulk explanation jobs of at least this many results use the Batches API
+    BATCH_MIN_SIZE = 50
+    BATCH_POLL_INTERVAL_SECONDS = 10
+    # Batches may take up to 24h; past this the batch is cancelled and the
+    # explanations are requested one by one instead
+    BATCH_MAX_WAIT_SECONDS = 600
+
     def __init__(self):
-        self.client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+        # Async client so Claude round-trips don't block the event loop; one
+        # pooled HTTP/2 connection set is reused for the process lifetime
+        self.client = anthropic.AsyncAnthropic(
+            api_key=settings.ANTHROPIC_API_KEY,
+            http_client=anthropic.DefaultAsyncHttpxClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32)
+            )
+        )
         self.model = settings.CLAUDE_MODEL
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections"""
+        await self.client.close()
+
     async def generate_summary(
         self,
         query: str,
-        risk_analyses: List[TrademarkRiskAnalysis]
+        risk_analyses: List[TrademarkRiskAnalysis],
+        cache: Optional[SummaryCache] = None
     ) -> SearchResultsSummary:
         """
         Generate TL;DR summary of all search results with recommendations
@@ -33,129 +215,198 @@ class AIAnalyzer:
         Args:
             query: Original search query
             risk_analyses: List of all risk analyses
+            cache: Optional SummaryCache; only successful Claude summaries are stored
 
         Returns:
             SearchResultsSummary with AI-generated insights
         """
-        # Calculate risk distribution
-        risk_distribution = {
-            "critical": sum(1 for r in risk_analyses if r.risk_level == RiskLevel.CRITICAL),
-            "high": sum(1 for r in risk_analyses if r.risk_level == RiskLevel.HIGH),
-            "medium": sum(1 for r in risk_analyses if r.risk_level == RiskLevel.MEDIUM),
-            "low": sum(1 for r in risk_analyses if r.risk_level == RiskLevel.LOW),
-        }
+        risk_distribution, overall_risk = self._risk_overview(risk_analyses)
 
-        # Determine overall risk level
-        if risk_distribution["critical"] > 0:
-            overall_risk = RiskLevel.CRITICAL
-        elif risk_distribution["high"] >= 2:
-            overall_risk = RiskLevel.HIGH
-        elif risk_distribution["high"] >= 1 or risk_distribution["medium"] >= 3:
-            overall_risk = RiskLevel.MEDIUM
-        else:
-            overall_risk = RiskLevel.LOW
+        # Nothing above LOW: the canned summary says all there is to say
+        if self._is_clear(risk_distribution, overall_risk):
+            return self._generate_fallback_summary(
+                query, risk_analyses, overall_risk, risk_distribution
+            )
+
+        # SQLite work stays off the event loop
+        if cache:
+            cached = await asyncio.to_thread(cache.get, query, risk_analyses)
+            if cached:
+                return cached
 
         # Prepare context for Claude
         context = self._prepare_summary_context(query, risk_analyses, risk_distribution)
 
         # Generate AI summary
         try:
-            message = self.client.messages.create(
+            message = await self.client.messages.create(
                 model=self.model,
                 max_tokens=1500,
                 temperature=0.3,
+                system=_cached_system(SUMMARY_SYSTEM_PROMPT),
+                tools=[SUMMARY_TOOL],
+                tool_choice={"type": "tool", "name": SUMMARY_TOOL["name"]},
                 messages=[{
                     "role": "user",
                     "content": context
                 }]
             )
+            _log_usage("summary", message)
 
-            response_text = message.content[0].text
-
-            # Parse Claude's response
-            summary_data = self._parse_summary_response(response_text)
-
-            return SearchResultsSummary(
-                query=query,
-                total_results=len(risk_analyses),
-                overall_risk_level=overall_risk,
-                risk_distribution=risk_distribution,
-                key_findings=summary_data.get("key_findings", []),
-                recommendations=summary_data.get("recommendations", []),
-                summary=summary_data.get("summary", ""),
-                estimated_timeline=summary_data.get("timeline"),
-                suggested_next_steps=summary_data.get("next_steps", [])
+            summary = self._build_summary(
+                query, risk_analyses, overall_risk, risk_distribution, message.content[0].input
             )
 
-        except Exception as e:
-            print(f"Error generating AI summary: {e}")
+            if cache:
+                await asyncio.to_thread(cache.put, query, risk_analyses, summary)
+
+            return summary
+
+        except Exception:
+            logger.exception("Error generating AI summary")
             # Fallback to basic summary
             return self._generate_fallback_summary(
                 query, risk_analyses, overall_risk, risk_distribution
             )
 
-    def _prepare_summary_context(
+    async def stream_summary(
         self,
         query: str,
         risk_analyses: List[TrademarkRiskAnalysis],
-        risk_distribution: dict
-    ) -> str:
-        """Prepare context for Claude to generate summary"""
+        cache: Optional[SummaryCache] = None
+    ) -> AsyncIterator[Union[str, SearchResultsSummary]]:
+        """
+        Stream the summary as Claude generates it
 
-        # Get top 5 highest risk items
-        top_risks = sorted(risk_analyses, key=lambda x: x.risk_score, reverse=True)[:5]
+        Yields partial JSON of the emit_summary tool input as it arrives,
+        then the SearchResultsSummary as the final item. Clear searches,
+        cache hits and failures yield only the final summary.
+        """
+        risk_distribution, overall_risk = self._risk_overview(risk_analyses)
 
-        context = f"""You are a trademark attorney analyzing search results for potential conflicts.
+        if self._is_clear(risk_distribution, overall_risk):
+            yield self._generate_fallback_summary(
+                query, risk_analyses, overall_risk, risk_distribution
+            )
+            return
 
-SEARCH QUERY: "{query}"
+        if cache:
+            cached = await asyncio.to_thread(cache.get, query, risk_analyses)
+            if cached:
+                yield cached
+                return
 
-RESULTS OVERVIEW:
-- Total trademarks found: {len(risk_analyses)}
-- Critical risk: {risk_distribution['critical']}
-- High risk: {risk_distribution['high']}
-- Medium risk: {risk_distribution['medium']}
-- Low risk: {risk_distribution['low']}
+        context = self._prepare_summary_context(query, risk_analyses, risk_distribution)
 
-TOP RISK ITEMS:
-"""
+        try:
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=1500,
+                temperature=0.3,
+                system=_cached_system(SUMMARY_SYSTEM_PROMPT),
+                tools=[SUMMARY_TOOL],
+                tool_choice={"type": "tool", "name": SUMMARY_TOOL["name"]},
+                messages=[{
+                    "role": "user",
+                    "content": context
+                }]
+            ) as stream:
+                async for event in stream:
+                    if event.type == "input_json" and event.partial_json:
+                        yield event.partial_json
+                message = await stream.get_final_message()
+            _log_usage("summary stream", message)
+
+            summary = self._build_summary(
+                query, risk_analyses, overall_risk, risk_distribution, message.content[0].input
+            )
+        except Exception:
+            logger.exception("Error streaming AI summary")
+            yield self._generate_fallback_summary(
+                query, risk_analyses, overall_risk, risk_distribution
+            )
+            return
 
-        for i, risk in enumerate(top_risks, 1):
-            context += f"\n{i}. {risk.mark_text} (Risk: {risk.risk_score:.0f}/100 - {risk.risk_level.upper()})"
-            context += f"\n   Reason: {risk.conflict_reason}\n"
-
-        context += """
-Generate a concise analysis in JSON format with:
-
-{
-  "summary": "2-3 sentence overview of the trademark landscape and overall risk",
-  "key_findings": ["finding 1", "finding 2", "finding 3"],
-  "recommendations": ["actionable recommendation 1", "recommendation 2", "recommendation 3"],
-  "timeline": "estimated timeline for next steps (e.g., '2-4 weeks for initial clearance')",
-  "next_steps": ["specific next step 1", "step 2", "step 3"]
-}
+        if cache:
+            await asyncio.to_thread(cache.put, query, risk_analyses, summary)
+        yield summary
 
-Be direct, professional, and action-oriented. Focus on what the user should do."""
+    def fallback_summary(self, query: str, risk_analyses: List[TrademarkRiskAnalysis]) -> SearchResultsSummary:
+        """Canned (non-AI) summary for these results, e.g. after a failed stream"""
+        risk_distribution, overall_risk = self._risk_overview(risk_analyses)
+        return self._generate_fallback_summary(query, risk_analyses, overall_risk, risk_distribution)
 
-        return context
+    def _risk_overview(self, risk_analyses: List[TrademarkRiskAnalysis]) -> tuple[dict, RiskLevel]:
+        """Risk distribution counts and the overall risk level they imply"""
+        counts = Counter(r.risk_level for r in risk_analyses)
+        risk_distribution = {
+            "critical": counts[RiskLevel.CRITICAL],
+            "high": counts[RiskLevel.HIGH],
+            "medium": counts[RiskLevel.MEDIUM],
+            "low": counts[RiskLevel.LOW],
+        }
 
-    def _parse_summary_response(self, response_text: str) -> dict:
-        """Parse Claude's JSON response"""
-        try:
-            # Extract JSON from response
-            start = response_text.find("{")
-            end = response_text.rfind("}") + 1
-            if start != -1 and end > start:
-                json_str = response_text[start:end]
-                return json.loads(json_str)
-        except:
-            pass
+        # Determine overall risk level
+        if risk_distribution["critical"] > 0:
+            overall_risk = RiskLevel.CRITICAL
+        elif risk_distribution["high"] >= 2:
+            overall_risk = RiskLevel.HIGH
+        elif risk_distribution["high"] >= 1 or risk_distribution["medium"] >= 3:
+            overall_risk = RiskLevel.MEDIUM
+        else:
+            overall_risk = RiskLevel.LOW
 
-        return {
-            "summary": response_text,
-            "key_findings": [],
-            "recommendations": [],
-            "next_steps": []
-        }
+        return risk_distribution, overall_risk
+
+    @staticmethod
+    def _is_clear(risk_distribution: dict, overall_risk: RiskLevel) -> bool:
+        """True when every result is LOW risk (or there are none), so Claude is skipped"""
+        return overall_risk is RiskLevel.LOW and risk_distribution["medium"] == 0
+
+    def _build_summary(
+        self,
+        query: str,
+        risk_analyses: List[TrademarkRiskAnalysis],
+        overall_risk: RiskLevel,
+        risk_distribution: dict,
+        summary_data: dict
+    ) -> SearchResultsSummary:
+        """Build a SearchResultsSummary from the emit_summary tool input"""
+        return SearchResultsSummary(
+            query=query,
+            total_results=len(risk_analyses),
+            overall_risk_level=overall_risk,
+            risk_distribution=risk_distribution,
+            key_findings=summary_data.get("key_findings", []),
+            recommendations=summary_data.get("recommendations", []),
+            summary=summary_data.get("summary", ""),
+            estimated_timeline=summary_data.get("timeline"),
+            suggested_next_steps=summary_data.get("next_steps", [])
+        )
+
+    def _prepare_summary_context(
+        self,
+        query: str,
+        risk_analyses: List[TrademarkRiskAnalysis],
+        risk_distribution: dict
+    ) -> str:
+        """Prepare the per-search part of the prompt (instructions live in SUMMARY_SYSTEM_PROMPT)"""
+
+        # Get top 5 highest risk items
+        top_risks = heapq.nlargest(5, risk_analyses, key=lambda x: x.risk_score)
+
+        parts = [SUMMARY_CONTEXT_HEADER.format(
+            query=query,
+            total=len(risk_analyses),
+            **risk_distribution
+        )]
+        for i, risk in enumerate(top_risks, 1):
+            parts.append(
+                f"\n{i}. {risk.mark_text} (Risk: {risk.risk_score:.0f}/100 - {_RISK_LEVEL_LABELS[risk.risk_level]})"
+                f"\n   Reason: {risk.conflict_reason}\n"
+            )
+
+        return "".join(parts)
 
     def _generate_fallback_summary(
         self,
@@ -165,35 +416,8 @@ Be direct, professional, and action-oriented. Focus on what the user should do."
         risk_distribution: dict
     ) -> SearchResultsSummary:
         """Generate basic summary if AI fails"""
-
-        if overall_risk == RiskLevel.CRITICAL:
-            summary = f"Found {risk_distribution['critical']} critical conflicts for '{query}'. Immediate legal review recommended."
-            recommendations = [
-                "Consult a trademark attorney immediately",
-                "Consider alternative brand names",
-                "Do not proceed without legal clearance"
-            ]
-        elif overall_risk == RiskLevel.HIGH:
-            summary = f"Found {risk_distribution['high']} high-risk conflicts for '{query}'. Professional review strongly advised."
-            recommendations = [
-                "Conduct comprehensive trademark search",
-                "Consult with trademark attorney",
-                "Evaluate alternative names or modifications"
-            ]
-        elif overall_risk == RiskLevel.MEDIUM:
-            summary = f"Found some potential conflicts for '{query}'. Further analysis recommended."
-            recommendations = [
-                "Review similar marks in detail",
-                "Consider filing in different classes",
-                "Consult attorney for risk assessment"
-            ]
-        else:
-            summary = f"No significant conflicts found for '{query}'. Preliminary clearance looks favorable."
-            recommendations = [
-                "Proceed with comprehensive search",
-                "Consider trademark registration",
-                "Monitor for new applications"
-            ]
+        template, recommendations = _FALLBACK_SUMMARIES[overall_risk]
+        summary = template.format(query=query, count=risk_distribution[overall_risk.value])
 
         return SearchResultsSummary(
             query=query,
@@ -201,7 +425,7 @@ Be direct, professional, and action-oriented. Focus on what the user should do."
             overall_risk_level=overall_risk,
             risk_distribution=risk_distribution,
             key_findings=[f"Analyzed {len(risk_analyses)} existing trademarks"],
-            recommendations=recommendations,
+            recommendations=list(recommendations),
             summary=summary,
             suggested_next_steps=["Contact trademark attorney", "Conduct full search"]
         )
@@ -222,25 +446,114 @@ Be direct, professional, and action-oriented. Focus on what the user should do."
             Enhanced explanation string
         """
         try:
-            prompt = f"""Briefly explain why the trademark "{risk_analysis.mark_text}" poses a {risk_analysis.risk_level.upper()} risk to the proposed mark "{query}".
+            message = await self.client.messages.create(
+                **self._explanation_params(risk_analysis, query)
+            )
+            _log_usage("explanation", message)
 
-Risk Score: {risk_analysis.risk_score:.0f}/100
-Conflict: {risk_analysis.conflict_reason}
+            return message.content[0].text.strip()
 
-Provide a 1-2 sentence explanation focusing on the specific conflict issues."""
+        except Exception:
+            logger.exception("Error enhancing explanation")
+            return risk_analysis.risk_explanation
 
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=200,
-                temperature=0.3,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
+    async def enhance_risk_explanations_bulk(
+        self,
+        risk_analyses: List[TrademarkRiskAnalysis],
+        query: str
+    ) -> Dict[str, str]:
+        """
+        Enhance explanations for many trademarks (non-interactive use, e.g. reports)
+
+        At BATCH_MIN_SIZE results or more, all prompts are submitted as one
+        Message Batch (half the token price, results typically within
+        minutes, at most 24h); smaller sets are sent as concurrent requests.
+        A batch still running after BATCH_MAX_WAIT_SECONDS is cancelled and
+        falls back to concurrent requests. Failed items keep their existing
+        risk_explanation.
+
+        Args:
+            risk_analyses: Risk analyses to enhance
+            query: Original search query
+
+        Returns:
+            Dict of serial_number -> explanation
+        """
+        by_serial = {ra.serial_number: ra for ra in risk_analyses}
+
+        if len(by_serial) < self.BATCH_MIN_SIZE:
+            return await self._enhance_each(by_serial, query)
+
+        explanations = {serial: ra.risk_explanation for serial, ra in by_serial.items()}
+
+        try:
+            batch = await self.client.messages.batches.create(
+                requests=[
+                    {"custom_id": serial, "params": self._explanation_params(ra, query)}
+                    for serial, ra in by_serial.items()
+                ]
+            )
+            logger.info("Submitted explanation batch %s (%d requests)", batch.id, len(by_serial))
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.BATCH_MAX_WAIT_SECONDS
+            while batch.processing_status != "ended":
+                if loop.time() >= deadline:
+                    logger.warning(
+                        "Explanation batch %s still %s after %ds; cancelling",
+                        batch.id, batch.processing_status, self.BATCH_MAX_WAIT_SECONDS
+                    )
+                    try:
+                        await self.client.messages.batches.cancel(batch.id)
+                    except Exception:
+                        logger.exception("Error cancelling explanation batch %s", batch.id)
+                    return await self._enhance_each(by_serial, query)
+                await asyncio.sleep(self.BATCH_POLL_INTERVAL_SECONDS)
+                batch = await self.client.messages.batches.retrieve(batch.id)
+
+            async for entry in await self.client.messages.batches.results(batch.id):
+                if entry.result.type == "succeeded":
+                    explanations[entry.custom_id] = entry.result.message.content[0].text.strip()
+                else:
+                    logger.warning("Batch item %s %s", entry.custom_id, entry.result.type)
+
+            counts = batch.request_counts
+            logger.info(
+                "Explanation batch %s ended: %d succeeded, %d errored",
+                batch.id, counts.succeeded, counts.errored
             )
 
-            return message.content[0].text.strip()
+        except Exception:
+            logger.exception("Error enhancing explanations in batch")
 
-        except Exception as e:
-            print(f"Error enhancing explanation: {e}")
-            return risk_analysis.risk_explanation
+        return explanations
+
+    async def _enhance_each(
+        self,
+        by_serial: Dict[str, TrademarkRiskAnalysis],
+        query: str
+    ) -> Dict[str, str]:
+        """Enhance explanations with one concurrent request per trademark"""
+        explanations = await asyncio.gather(
+            *(self.enhance_risk_explanation(ra, query) for ra in by_serial.values())
+        )
+        return dict(zip(by_serial, explanations))
+
+    def _explanation_params(self, risk_analysis: TrademarkRiskAnalysis, query: str) -> dict:
+        """messages.create parameters for one risk explanation"""
+        prompt = f"""PROPOSED MARK: "{query}"
+EXISTING MARK: "{risk_analysis.mark_text}" ({risk_analysis.risk_level.upper()} risk)
+
+Risk Score: {risk_analysis.risk_score:.0f}/100
+Conflict: {risk_analysis.conflict_reason}"""
+
+        return {
+            "model": self.model,
+            "max_tokens": 200,
+            "temperature": 0.3,
+            "system": _cached_system(EXPLANATION_SYSTEM_PROMPT),
+            "messages": [{
+                "role": "user",
+                "content": prompt
+            }]
+        }
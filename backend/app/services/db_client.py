@@ -3,8 +3,19 @@ Supabase PostgreSQL Client for USPTO Trademark Database
 """
 import psycopg2
 import psycopg2.extras
-from typing import List, Dict, Optional
+import psycopg2.pool
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial
+from types import MappingProxyType
+from typing import Iterator, List, Dict, Optional
+import asyncio
+import logging
 import os
+import re
+import threading
+import time
 from dotenv import load_dotenv
 from datetime import datetime
 
@@ -12,12 +23,193 @@ from app.models.trademark import Trademark, TrademarkStatus
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+
+# Search queries in psycopg2 pyformat, as run on iter_search_trademarks'
+# server-side cursor; their PREPARE forms below are derived from these.
+# tsquery is the already-sanitized to_tsquery input (see _tsquery_text),
+# query the raw search text.
+SEARCH_PARAMS = ('tsquery', 'query', 'limit')
+SEARCH_QUERIES = {
+    'ts_search': """
+        SELECT
+            serial_number, mark_text, owner_name, status,
+            filing_date, registration_date, registration_number,
+            international_classes, goods_services,
+            ts_rank(search_vector, query) AS rank
+        FROM trademarks, to_tsquery('english', %(tsquery)s) query
+        WHERE search_vector @@ query
+        ORDER BY rank DESC
+        LIMIT %(limit)s
+    """,
+    'trgm_search': """
+        SELECT
+            serial_number, mark_text, owner_name, status,
+            filing_date, registration_date, registration_number,
+            international_classes, goods_services,
+            GREATEST(ts_rank(search_vector, query), similarity(mark_text, %(query)s)) AS rank
+        FROM trademarks, to_tsquery('english', %(tsquery)s) query
+        WHERE search_vector @@ query OR mark_text %% %(query)s
+        ORDER BY rank DESC
+        LIMIT %(limit)s
+    """,
+}
+
+# Wraps a search so each returned row also carries RiskScorer's text
+# similarity (0-100), computed in the database with fuzzystrmatch (see
+# migrations/003_db_similarity.sql): the greatest of 80 for a shared Double
+# Metaphone code, 70 when one contains the other, and normalized
+# Levenshtein similarity. Only the LIMITed rows are scored. NULL (scored in
+# Python instead) for strings past fuzzystrmatch's 255-character limit.
+_SCORED_SEARCH = """
+        SELECT s.*,
+            CASE
+                WHEN n.mark = n.query THEN 100.0
+                WHEN GREATEST(length(n.mark), length(n.query)) > 255 THEN NULL
+                ELSE GREATEST(
+                    CASE WHEN array_remove(ARRAY[dmetaphone(n.mark), dmetaphone_alt(n.mark)], '')
+                        && ARRAY[dmetaphone(n.query), dmetaphone_alt(n.query)] THEN 80.0 ELSE 0.0 END,
+                    CASE WHEN strpos(n.mark, n.query) > 0 OR strpos(n.query, n.mark) > 0 THEN 70.0 ELSE 0.0 END,
+                    (1 - levenshtein(n.mark, n.query)::float8
+                        / GREATEST(length(n.mark), length(n.query))) * 100
+                )
+            END AS similarity_score
+        FROM ({search}) s,
+            LATERAL (SELECT UPPER(TRIM(s.mark_text)) AS mark, UPPER(TRIM(%(query)s)) AS query) n
+        ORDER BY s.rank DESC
+"""
+for _name in list(SEARCH_QUERIES):
+    SEARCH_QUERIES[f'{_name}_scored'] = _SCORED_SEARCH.format(search=SEARCH_QUERIES[_name])
+
+
+def _prepare_search(name: str) -> str:
+    """PREPARE statement for a SEARCH_QUERIES entry ($n follows SEARCH_PARAMS)"""
+    body = SEARCH_QUERIES[name]
+    for i, param in enumerate(SEARCH_PARAMS, 1):
+        body = body.replace(f'%({param})s', f'${i}')
+    return f"PREPARE {name}(text, text, integer) AS{body.replace('%%', '%')}"
+
+
+_TSQUERY_WORD = re.compile(r"\w+")
+
+
+def _tsquery_text(query: str) -> str:
+    """
+    AND together the words of a search for to_tsquery
+
+    Raw input is not valid tsquery syntax as soon as it has spaces or
+    operators (& | ! : * ( ) '), so only word characters are kept.
+    """
+    return ' & '.join(_TSQUERY_WORD.findall(query))
+
+
+# Hot-path queries, PREPAREd once per pooled connection so repeat calls skip
+# parse/plan (run with EXECUTE name(...))
+PREPARED_STATEMENTS = {
+    'ts_search': _prepare_search('ts_search'),
+    'trgm_search': _prepare_search('trgm_search'),
+    'ts_search_scored': _prepare_search('ts_search_scored'),
+    'trgm_search_scored': _prepare_search('trgm_search_scored'),
+    'exact_match': """
+        PREPARE exact_match(text) AS
+        SELECT * FROM trademarks
+        WHERE UPPER(mark_text) = UPPER($1)
+        LIMIT 1
+    """,
+    'by_serial': """
+        PREPARE by_serial(text) AS
+        SELECT * FROM trademarks WHERE serial_number = $1
+    """,
+}
+
+
+# Raw status strings (upper-cased) to TrademarkStatus; anything else is UNKNOWN
+_STATUS_MAP = MappingProxyType({
+    'REGISTERED': TrademarkStatus.REGISTERED,
+    'REG': TrademarkStatus.REGISTERED,
+    'LIVE': TrademarkStatus.REGISTERED,
+    'PENDING': TrademarkStatus.PENDING,
+    'PUB': TrademarkStatus.PENDING,
+    'PUBLISHED': TrademarkStatus.PENDING,
+    'ABANDONED': TrademarkStatus.ABANDONED,
+    'DEAD': TrademarkStatus.ABANDONED,
+    'CANCELLED': TrademarkStatus.CANCELLED,
+    'CANCELED': TrademarkStatus.CANCELLED,
+    'EXPIRED': TrademarkStatus.EXPIRED,
+})
+
+
+def _as_date(value):
+    """Normalize a date column value (timestamps are truncated to their date)"""
+    return value.date() if isinstance(value, datetime) else value
+
+
+class _LookupCache:
+    """Thread-safe LRU with a TTL for repeated point lookups"""
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return (hit, value)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                return False, None
+            self._entries.move_to_end(key)
+            return True, entry[1]
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+class _PreparingConnection(psycopg2.extensions.connection):
+    """Connection that tracks which PREPARED_STATEMENTS it has created"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
 
 class PostgreSQLClient:
     """PostgreSQL client for database operations (Railway, Supabase, or any PostgreSQL)"""
 
-    def __init__(self):
-        """Initialize connection to PostgreSQL database (Railway or Supabase)"""
+    def __init__(
+        self,
+        trigram_search: bool = False,
+        db_similarity: bool = False,
+        min_connections: int = 2,
+        max_connections: int = 16,
+        lookup_cache_size: int = 4096,
+        lookup_cache_ttl_seconds: float = 60,
+        search_cache_size: int = 256,
+        statement_timeout_ms: int = 5000
+    ):
+        """
+        Initialize connection to PostgreSQL database (Railway or Supabase)
+
+        Args:
+            trigram_search: Also match marks by pg_trgm similarity in
+                search_trademarks (requires migrations/001_trigram_search.sql)
+            db_similarity: Compute RiskScorer's text similarity for search
+                results in the database (requires migrations/003_db_similarity.sql)
+            min_connections: Connections the pool keeps open
+            max_connections: Upper bound on concurrent connections
+            lookup_cache_size: Entries kept for search_exact_match/count_trademarks
+            lookup_cache_ttl_seconds: How long those results (and cached
+                searches) are reused (0 disables both caches)
+            search_cache_size: search_trademarks result sets kept (0 disables)
+            statement_timeout_ms: Server-side cap on each query (0 disables);
+                SQL files and CSV imports run without it
+        """
         # Database connection details
         # Format: postgresql://postgres:[PASSWORD]@[HOST]:[PORT]/[DATABASE]
         self.connection_string = os.getenv('DATABASE_URL') or os.getenv('SUPABASE_DB_URL')
@@ -28,64 +220,228 @@ class PostgreSQLClient:
                 "Add your PostgreSQL connection string to scripts/.env file"
             )
 
-        self.conn = None
-        self.cursor = None
+        self.trigram_search = trigram_search
+        self.db_similarity = db_similarity
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.statement_timeout_ms = statement_timeout_ms
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        # getconn() raises instead of waiting when the pool is exhausted, so
+        # callers queue on this semaphore for a free connection
+        self._pool_slots = threading.BoundedSemaphore(max_connections)
+        # Connection of the transaction() open on the current thread, if any
+        self._local = threading.local()
+
+        # Writes through this client bump the generation, which is part of
+        # every lookup cache key, so results read before an import are never
+        # served after it. Writes from other processes show up within the TTL.
+        self._lookups = _LookupCache(lookup_cache_size, lookup_cache_ttl_seconds) if lookup_cache_ttl_seconds > 0 else None
+        # Search result sets are far larger than point lookups, so they get
+        # their own, smaller LRU
+        self._searches = (
+            _LookupCache(search_cache_size, lookup_cache_ttl_seconds)
+            if lookup_cache_ttl_seconds > 0 and search_cache_size > 0 else None
+        )
+        self._generation = 0
 
     def connect(self):
-        """Establish database connection"""
-        if self.conn is None:
+        """Create the connection pool (no-op if it already exists)"""
+        with self._pool_lock:
+            if self._pool is not None:
+                return
             try:
-                self.conn = psycopg2.connect(
-                    self.connection_string,
-                    cursor_factory=psycopg2.extras.RealDictCursor
+                self._pool = psycopg2.pool.ThreadedConnectionPool(
+                    self.min_connections,
+                    self.max_connections,
+                    dsn=self.connection_string,
+                    cursor_factory=psycopg2.extras.RealDictCursor,
+                    connection_factory=_PreparingConnection,
+                    application_name='uspto-analyzer',
+                    # A runaway query or a transaction left open fails instead
+                    # of holding a pooled connection indefinitely
+                    options=(
+                        f'-c statement_timeout={self.statement_timeout_ms} '
+                        '-c idle_in_transaction_session_timeout=10000'
+                    ),
+                    # Detect dead server connections in ~1 minute rather than
+                    # waiting on OS-level TCP timeouts
+                    keepalives=1,
+                    keepalives_idle=30,
+                    keepalives_interval=10,
+                    keepalives_count=3
                 )
-                self.conn.autocommit = True
-                self.cursor = self.conn.cursor()
-                print("✅ Connected to PostgreSQL database")
-            except Exception as e:
-                print(f"❌ Failed to connect to Supabase: {e}")
+                logger.info("Connected to PostgreSQL database (pool %d-%d)", self.min_connections, self.max_connections)
+            except Exception:
+                logger.exception("Failed to connect to PostgreSQL database")
                 raise
 
     def disconnect(self):
-        """Close database connection"""
-        if self.cursor:
-            self.cursor.close()
-        if self.conn:
-            self.conn.close()
-        print("Disconnected from PostgreSQL database")
+        """Close all pooled connections"""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
+        logger.info("Disconnected from PostgreSQL database")
+
+    @contextmanager
+    def _connection(self) -> Iterator[_PreparingConnection]:
+        """Borrow a pooled connection, waiting for a free one if necessary"""
+        conn = getattr(self._local, 'transaction', None)
+        if conn is not None:
+            # Inside transaction(): keep using its connection
+            yield conn
+            return
+
+        self.connect()
+
+        with self._pool_slots:
+            conn = self._pool.getconn()
+            try:
+                yield conn
+            finally:
+                # Drop connections that died mid-query instead of reusing them
+                self._pool.putconn(conn, close=bool(conn.closed))
+
+    @contextmanager
+    def _cursor(self, statement_timeout: bool = True) -> Iterator[psycopg2.extras.RealDictCursor]:
+        """
+        Borrow a pooled connection and yield an autocommit cursor on it
+
+        statement_timeout=False lifts the connection's statement timeout for
+        long-running work (DDL, COPY) until the cursor is released.
+        """
+        with self._connection() as conn:
+            if not conn.autocommit and conn is not getattr(self._local, 'transaction', None):
+                conn.autocommit = True
+            with conn.cursor() as cursor:
+                if statement_timeout:
+                    yield cursor
+                    return
+                cursor.execute("SET statement_timeout = 0")
+                try:
+                    yield cursor
+                finally:
+                    if not conn.closed:
+                        cursor.execute("RESET statement_timeout")
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Run this thread's queries in one transaction, committed on exit
+
+        Writes otherwise autocommit one statement at a time; wrapping an
+        import loop pays for a single commit (and WAL flush) at the end
+        instead. Rolls back if the block raises; note that any failed
+        statement aborts the rest of the transaction. Nested calls join
+        the outer transaction.
+        """
+        if getattr(self._local, 'transaction', None) is not None:
+            yield
+            return
+
+        with self._connection() as conn:
+            conn.autocommit = False
+            self._local.transaction = conn
+            try:
+                yield
+                conn.commit()
+                # Lookups cached by other threads mid-transaction are stale now
+                self._invalidate_lookups()
+            except BaseException:
+                if not conn.closed:
+                    conn.rollback()
+                raise
+            finally:
+                self._local.transaction = None
+
+    def _execute_prepared(self, cursor, name: str, params: tuple):
+        """EXECUTE a named statement, PREPAREing it on first use per connection"""
+        conn = cursor.connection
+        if name not in conn.prepared:
+            cursor.execute(PREPARED_STATEMENTS[name])
+            conn.prepared.add(name)
+        placeholders = ", ".join(["%s"] * len(params))
+        cursor.execute(f"EXECUTE {name}({placeholders})", params)
+
+    def _cached_lookup(self, key: tuple, fetch, search: bool = False):
+        """Return fetch() through the lookup (or search) cache, if enabled"""
+        cache = self._searches if search else self._lookups
+        if cache is None:
+            return fetch()
+        key = (self._generation,) + key
+        hit, value = cache.get(key)
+        if not hit:
+            value = fetch()
+            cache.put(key, value)
+        return value
+
+    def _invalidate_lookups(self) -> None:
+        self._generation += 1
+
+    def clear_lookup_caches(self) -> None:
+        """Stop serving cached lookups and searches (e.g. after an import by another process)"""
+        self._invalidate_lookups()
 
     def execute_sql_file(self, file_path: str):
         """Execute SQL from file (e.g., schema.sql)"""
-        if not self.conn:
-            self.connect()
-
         with open(file_path, 'r') as f:
             sql = f.read()
 
         try:
-            self.cursor.execute(sql)
-            print(f"✅ Executed SQL file: {file_path}")
-        except Exception as e:
-            print(f"❌ Error executing SQL file: {e}")
+            with self._cursor(statement_timeout=False) as cursor:
+                cursor.execute(sql)
+            self._invalidate_lookups()
+            logger.info("Executed SQL file: %s", file_path)
+        except Exception:
+            logger.exception("Error executing SQL file %s", file_path)
             raise
 
+    # Column order shared by the upsert statement and its row tuples
+    UPSERT_COLUMNS = (
+        'serial_number', 'mark_text', 'owner_name', 'status',
+        'filing_date', 'registration_date', 'registration_number',
+        'international_classes', 'goods_services'
+    )
+
     def insert_trademark(self, trademark_data: Dict) -> bool:
-        """Insert single trademark record"""
-        if not self.conn:
-            self.connect()
+        """
+        Insert single trademark record
 
+        Import loops should call bulk_upsert_trademarks with batches instead
+        (or at least run inside transaction()); this costs one round-trip
+        per record.
+        """
         try:
-            self.cursor.execute(
+            self.bulk_upsert_trademarks([trademark_data])
+            return True
+        except Exception:
+            logger.exception("Error inserting trademark %s", trademark_data.get('serial_number'))
+            return False
+
+    def bulk_upsert_trademarks(self, rows: List[Dict], page_size: int = 500) -> int:
+        """
+        Insert or update many trademark records with multi-row statements
+
+        Rows are sent page_size per INSERT via execute_values. A serial number
+        repeated within rows keeps its last occurrence (PostgreSQL rejects
+        one statement updating the same row twice). Returns rows written.
+        """
+        by_serial = {row['serial_number']: row for row in rows}
+        values = [tuple(row.get(col) for col in self.UPSERT_COLUMNS) for row in by_serial.values()]
+        if not values:
+            return 0
+
+        # One commit for all pages rather than one per page
+        with self.transaction(), self._cursor() as cursor:
+            psycopg2.extras.execute_values(
+                cursor,
                 """
                 INSERT INTO trademarks (
                     serial_number, mark_text, owner_name, status,
                     filing_date, registration_date, registration_number,
                     international_classes, goods_services
-                ) VALUES (
-                    %(serial_number)s, %(mark_text)s, %(owner_name)s, %(status)s,
-                    %(filing_date)s, %(registration_date)s, %(registration_number)s,
-                    %(international_classes)s, %(goods_services)s
-                )
+                ) VALUES %s
                 ON CONFLICT (serial_number) DO UPDATE SET
                     mark_text = EXCLUDED.mark_text,
                     owner_name = EXCLUDED.owner_name,
@@ -97,22 +453,18 @@ class PostgreSQLClient:
                     goods_services = EXCLUDED.goods_services,
                     updated_at = NOW()
                 """,
-                trademark_data
+                values,
+                page_size=page_size
             )
-            return True
-        except Exception as e:
-            print(f"❌ Error inserting trademark {trademark_data.get('serial_number')}: {e}")
-            return False
+        self._invalidate_lookups()
+        return len(values)
 
     def bulk_insert_from_csv(self, csv_file_path: str, table_name: str = 'trademarks'):
         """Bulk insert from CSV using COPY (fastest method)"""
-        if not self.conn:
-            self.connect()
-
         try:
-            with open(csv_file_path, 'r') as f:
+            with open(csv_file_path, 'r') as f, self._cursor(statement_timeout=False) as cursor:
                 # Use COPY FROM for fast bulk insert
-                self.cursor.copy_expert(
+                cursor.copy_expert(
                     f"""
                     COPY {table_name} (
                         serial_number, mark_text, owner_name, status,
@@ -123,162 +475,233 @@ class PostgreSQLClient:
                     """,
                     f
                 )
-            print(f"✅ Bulk inserted from {csv_file_path}")
+            self._invalidate_lookups()
+            logger.info("Bulk inserted from %s", csv_file_path)
             return True
-        except Exception as e:
-            print(f"❌ Error bulk inserting from CSV: {e}")
+        except Exception:
+            logger.exception("Error bulk inserting from CSV %s", csv_file_path)
             raise
 
-    def search_trademarks(self, query: str, limit: int = 50) -> List[Trademark]:
-        """Search trademarks using full-text search"""
-        if not self.conn:
-            self.connect()
+    def _search_statement(self) -> str:
+        """SEARCH_QUERIES entry for this client's search options"""
+        statement = 'trgm_search' if self.trigram_search else 'ts_search'
+        return f'{statement}_scored' if self.db_similarity else statement
 
+    def search_trademarks(self, query: str, limit: int = 50) -> List[Trademark]:
+        """
+        Search trademarks using full-text search
+
+        With trigram_search enabled, marks that are merely similar to the
+        query (misspellings, spacing variants) also match; both predicates
+        are served by GIN indexes and combined with a bitmap OR. With
+        db_similarity enabled, results come with their similarity to the
+        query already computed (see RiskScorer.calculate_risk_score).
+
+        Matching ignores case and surrounding whitespace, so the query is
+        normalized first and repeats of it are served from the search cache.
+        """
+        query = query.upper().strip()
         try:
-            self.cursor.execute(
-                """
-                SELECT
-                    serial_number, mark_text, owner_name, status,
-                    filing_date, registration_date, registration_number,
-                    international_classes, goods_services,
-                    ts_rank(search_vector, query) AS rank
-                FROM trademarks, to_tsquery('english', %s) query
-                WHERE search_vector @@ query
-                ORDER BY rank DESC
-                LIMIT %s
-                """,
-                (query, limit)
+            rows = self._cached_lookup(
+                ('search', query, limit),
+                partial(self._fetch_search, query, limit),
+                search=True
             )
-            results = self.cursor.fetchall()
-            return [self._dict_to_trademark(dict(row)) for row in results]
-        except Exception as e:
-            print(f"❌ Error searching trademarks: {e}")
+            # Fresh models per call: callers (e.g. TSDR enrichment) mutate them
+            return self._rows_to_trademarks(rows)
+        except Exception:
+            logger.exception("Error searching trademarks for %r", query)
             return []
 
-    def search_exact_match(self, mark_text: str) -> Optional[Dict]:
-        """Search for exact trademark match (case-insensitive)"""
-        if not self.conn:
-            self.connect()
+    def _fetch_search(self, query: str, limit: int) -> List[Dict]:
+        with self._cursor() as cursor:
+            self._execute_prepared(cursor, self._search_statement(), (_tsquery_text(query), query, limit))
+            return cursor.fetchall()
+
+    def iter_search_trademarks(self, query: str, limit: int = 50, itersize: int = 200) -> Iterator[Trademark]:
+        """
+        Search like search_trademarks, yielding results lazily
+
+        Rows come from a server-side (named) cursor, itersize per round-trip,
+        so large limits never hold the full result set in memory and callers
+        can start on the first rows early. The pooled connection stays
+        checked out until the iterator is exhausted or closed, and the server
+        ends the transaction if the caller pauses for more than 10 seconds.
+        """
+        statement = self._search_statement()
+        tsquery = _tsquery_text(query)
+
+        with self._connection() as conn:
+            # Named cursors only exist inside a transaction; end ours unless
+            # we are running inside the caller's transaction()
+            own_transaction = conn is not getattr(self._local, 'transaction', None)
+            if own_transaction:
+                conn.autocommit = False
+            try:
+                with conn.cursor(name='tm_search') as cursor:
+                    cursor.itersize = itersize
+                    cursor.execute(
+                        SEARCH_QUERIES[statement],
+                        {'tsquery': tsquery, 'query': query, 'limit': limit}
+                    )
+                    for row in cursor:
+                        yield self._dict_to_trademark(row)
+            finally:
+                if own_transaction and not conn.closed:
+                    conn.rollback()
 
+    def search_exact_match(self, mark_text: str) -> Optional[Dict]:
+        """
+        Search for exact trademark match (case-insensitive)
+
+        The UPPER(mark_text) comparison is served by the expression index in
+        migrations/002_exact_match_index.sql. Results (including no match)
+        are served from the lookup cache on repeats; treat the returned row
+        as read-only.
+        """
         try:
-            self.cursor.execute(
-                """
-                SELECT * FROM trademarks
-                WHERE UPPER(mark_text) = UPPER(%s)
-                LIMIT 1
-                """,
-                (mark_text,)
+            return self._cached_lookup(
+                ('exact_match', mark_text.upper()),
+                partial(self._fetch_exact_match, mark_text)
             )
-            result = self.cursor.fetchone()
-            return dict(result) if result else None
-        except Exception as e:
-            print(f"❌ Error searching for exact match: {e}")
+        except Exception:
+            logger.exception("Error searching for exact match %r", mark_text)
             return None
 
+    def _fetch_exact_match(self, mark_text: str) -> Optional[Dict]:
+        with self._cursor() as cursor:
+            self._execute_prepared(cursor, 'exact_match', (mark_text,))
+            return cursor.fetchone()
+
     def get_trademark_by_serial(self, serial_number: str) -> Optional[Trademark]:
         """Get trademark by serial number"""
-        if not self.conn:
-            self.connect()
-
         try:
-            self.cursor.execute(
-                "SELECT * FROM trademarks WHERE serial_number = %s",
-                (serial_number,)
-            )
-            result = self.cursor.fetchone()
-            return self._dict_to_trademark(dict(result)) if result else None
-        except Exception as e:
-            print(f"❌ Error getting trademark by serial: {e}")
+            with self._cursor() as cursor:
+                self._execute_prepared(cursor, 'by_serial', (serial_number,))
+                result = cursor.fetchone()
+            return self._dict_to_trademark(result) if result else None
+        except Exception:
+            logger.exception("Error getting trademark by serial %s", serial_number)
             return None
 
     def count_trademarks(self, status_filter: Optional[str] = None) -> int:
-        """Count trademarks, optionally filtered by status"""
-        if not self.conn:
-            self.connect()
-
+        """Count trademarks, optionally filtered by status (cached like search_exact_match)"""
         try:
+            return self._cached_lookup(
+                ('count', status_filter),
+                partial(self._fetch_count, status_filter)
+            )
+        except Exception:
+            logger.exception("Error counting trademarks")
+            return 0
+
+    def _fetch_count(self, status_filter: Optional[str]) -> int:
+        with self._cursor() as cursor:
             if status_filter:
-                self.cursor.execute(
+                cursor.execute(
                     "SELECT COUNT(*) as count FROM trademarks WHERE status = %s",
                     (status_filter,)
                 )
             else:
-                self.cursor.execute("SELECT COUNT(*) as count FROM trademarks")
+                cursor.execute("SELECT COUNT(*) as count FROM trademarks")
 
-            result = self.cursor.fetchone()
-            return result['count'] if result else 0
-        except Exception as e:
-            print(f"❌ Error counting trademarks: {e}")
-            return 0
+            result = cursor.fetchone()
+        return result['count'] if result else 0
 
     def log_import(self, file_name: str, records_imported: int, records_failed: int, status: str, error_message: Optional[str] = None):
         """Log import results"""
-        if not self.conn:
-            self.connect()
-
         try:
-            self.cursor.execute(
-                """
-                INSERT INTO import_log (file_name, records_imported, records_failed, status, error_message, completed_at)
-                VALUES (%s, %s, %s, %s, %s, NOW())
-                """,
-                (file_name, records_imported, records_failed, status, error_message)
-            )
-            print(f"📝 Logged import: {file_name} - {records_imported} imported, {records_failed} failed")
-        except Exception as e:
-            print(f"❌ Error logging import: {e}")
+            with self._cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO import_log (file_name, records_imported, records_failed, status, error_message, completed_at)
+                    VALUES (%s, %s, %s, %s, %s, NOW())
+                    """,
+                    (file_name, records_imported, records_failed, status, error_message)
+                )
+            logger.info("Logged import: %s - %d imported, %d failed", file_name, records_imported, records_failed)
+        except Exception:
+            logger.exception("Error logging import %s", file_name)
+
+    def _rows_to_trademarks(self, rows: List[Dict]) -> List[Trademark]:
+        """Convert a fetched result set to Trademark models"""
+        to_trademark = self._dict_to_trademark
+        return [to_trademark(row) for row in rows]
 
     def _dict_to_trademark(self, row: Dict) -> Trademark:
-        """Convert database row dictionary to Trademark model"""
+        """
+        Convert database row dictionary to Trademark model
+
+        Every query selects the full trademark column set, so columns are
+        indexed directly; NULL text columns fall back to defaults.
+        """
         # Parse status string to TrademarkStatus enum
-        status_str = row.get('status', '').upper()
-        status_map = {
-            'REGISTERED': TrademarkStatus.REGISTERED,
-            'REG': TrademarkStatus.REGISTERED,
-            'LIVE': TrademarkStatus.REGISTERED,
-            'PENDING': TrademarkStatus.PENDING,
-            'PUB': TrademarkStatus.PENDING,
-            'PUBLISHED': TrademarkStatus.PENDING,
-            'ABANDONED': TrademarkStatus.ABANDONED,
-            'DEAD': TrademarkStatus.ABANDONED,
-            'CANCELLED': TrademarkStatus.CANCELLED,
-            'CANCELED': TrademarkStatus.CANCELLED,
-            'EXPIRED': TrademarkStatus.EXPIRED,
-        }
-        status = status_map.get(status_str, TrademarkStatus.UNKNOWN)
+        # Stored statuses are usually upper-case already; only upper() the rest
+        raw_status = row['status'] or ''
+        status = _STATUS_MAP.get(raw_status) or _STATUS_MAP.get(raw_status.upper(), TrademarkStatus.UNKNOWN)
 
         # Parse international classes (stored as array in PostgreSQL)
-        classes = row.get('international_classes', [])
+        classes = row['international_classes']
         if isinstance(classes, str):
             classes = [c.strip() for c in classes.split(',') if c.strip()]
         elif not isinstance(classes, list):
             classes = []
 
-        # Convert date objects to ISO format strings
-        filing_date = row.get('filing_date')
-        if isinstance(filing_date, datetime):
-            filing_date = filing_date.date().isoformat()
-        elif hasattr(filing_date, 'isoformat'):
-            filing_date = filing_date.isoformat()
-
-        registration_date = row.get('registration_date')
-        if isinstance(registration_date, datetime):
-            registration_date = registration_date.date().isoformat()
-        elif hasattr(registration_date, 'isoformat'):
-            registration_date = registration_date.isoformat()
-
-        return Trademark(
-            serial_number=row.get('serial_number', ''),
-            registration_number=row.get('registration_number'),
-            mark_text=row.get('mark_text', ''),
-            owner_name=row.get('owner_name', 'Unknown'),
+        trademark = Trademark(
+            serial_number=row['serial_number'],
+            registration_number=row['registration_number'],
+            mark_text=row['mark_text'] or '',
+            owner_name=row['owner_name'] or 'Unknown',
             status=status,
-            filing_date=filing_date,
-            registration_date=registration_date,
+            # DATE columns arrive as date objects, which the model takes as-is
+            filing_date=_as_date(row['filing_date']),
+            registration_date=_as_date(row['registration_date']),
             international_classes=classes,
-            goods_services_description=row.get('goods_services')
+            goods_services_description=row['goods_services']
+        )
+        # Only present on db_similarity searches
+        trademark._similarity_score = row.get('similarity_score')
+        return trademark
+
+
+class AsyncPostgreSQLClient:
+    """
+    Coroutine interface to PostgreSQLClient for the FastAPI app
+
+    psycopg2 is blocking, so each query runs on a dedicated thread pool
+    sized to the connection pool: DB waits never occupy the default
+    executor used for scoring, and there are never more threads blocked
+    on the database than there are connections to serve them.
+    """
+
+    def __init__(self, client: PostgreSQLClient):
+        self.client = client
+        self._executor = ThreadPoolExecutor(
+            max_workers=client.max_connections,
+            thread_name_prefix="postgres"
         )
 
+    async def _run(self, method, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(method, *args, **kwargs))
+
+    async def search_trademarks(self, query: str, limit: int = 50) -> List[Trademark]:
+        return await self._run(self.client.search_trademarks, query, limit)
+
+    async def search_exact_match(self, mark_text: str) -> Optional[Dict]:
+        return await self._run(self.client.search_exact_match, mark_text)
+
+    async def get_trademark_by_serial(self, serial_number: str) -> Optional[Trademark]:
+        return await self._run(self.client.get_trademark_by_serial, serial_number)
+
+    async def count_trademarks(self, status_filter: Optional[str] = None) -> int:
+        return await self._run(self.client.count_trademarks, status_filter)
+
+    def disconnect(self):
+        """Stop the executor and close pooled connections"""
+        self._executor.shutdown(wait=False)
+        self.client.disconnect()
+
 
 # For backwards compatibility
 SupabaseClient = PostgreSQLClient
@@ -286,7 +709,6 @@ SupabaseClient = PostgreSQLClient
 # Example usage
 if __name__ == "__main__":
     client = PostgreSQLClient()
-    client.connect()
 
     # Test: Count trademarks
     count = client.count_trademarks()
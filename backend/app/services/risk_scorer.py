@@ -1,14 +1,33 @@
 """
 Risk scoring logic for trademark conflict analysis
 """
-from typing import List, Set
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, ClassVar, Iterable, List, Optional, Set, Union
+import logging
+import re
 
 # Optional dependencies for advanced similarity matching
 try:
-    import Levenshtein
-    HAS_LEVENSHTEIN = True
+    from rapidfuzz import process
+    from rapidfuzz.distance import Levenshtein
+    HAS_RAPIDFUZZ = True
 except ImportError:
-    HAS_LEVENSHTEIN = False
+    HAS_RAPIDFUZZ = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Phonetic encoders: Double Metaphone, else Soundex + Metaphone
+try:
+    from metaphone import doublemetaphone
+    HAS_DOUBLE_METAPHONE = True
+except ImportError:
+    HAS_DOUBLE_METAPHONE = False
 
 try:
     import jellyfish
@@ -16,9 +35,155 @@ try:
 except ImportError:
     HAS_JELLYFISH = False
 
+HAS_PHONETIC = HAS_DOUBLE_METAPHONE or HAS_JELLYFISH
+
+# Optional automaton for famous-mark phrase matching (regex fallback)
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 from app.models.trademark import Trademark, TrademarkStatus
 from app.models.risk import RiskLevel, RiskFactors
 
+logger = logging.getLogger(__name__)
+
+# Part of every ScorerCache key: bump whenever a change alters the scores,
+# factors or conflict reasons produced for the same inputs, so persisted
+# results from the old algorithm stop being served
+SCORER_VERSION = 3
+
+
+@dataclass(slots=True, frozen=True)
+class RiskFactorsCompact:
+    """
+    Slotted factor scores used while scoring
+
+    Avoids a Pydantic model (and its __dict__) per result on the hot path;
+    convert with to_model() when building the API response.
+    """
+    similarity_score: float
+    class_overlap_score: float
+    status_strength_score: float
+    use_commerce_score: float
+
+    def to_model(self) -> RiskFactors:
+        # All factor scores are bounded to 0-100, so skip validation
+        return RiskFactors.model_construct(
+            similarity_score=self.similarity_score,
+            class_overlap_score=self.class_overlap_score,
+            status_strength_score=self.status_strength_score,
+            use_commerce_score=self.use_commerce_score
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class QueryFingerprint:
+    """Normalized query text and its phonetic codes, computed once per search"""
+    text: str
+    phonetic_codes: frozenset[str]
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def _phrase_matcher(phrases: Iterable[str]) -> Callable[[str], bool]:
+    """
+    Build a test for whether text contains any of phrases as whole words
+
+    Uses an Aho-Corasick automaton (one pass over the text, independent of
+    the number of phrases) when pyahocorasick is installed, else a single
+    compiled alternation.
+    """
+    phrases = sorted(set(phrases), key=len, reverse=True)
+
+    if HAS_AHOCORASICK:
+        automaton = ahocorasick.Automaton()
+        for phrase in phrases:
+            automaton.add_word(phrase, len(phrase))
+        automaton.make_automaton()
+
+        def contains(text: str) -> bool:
+            for end, length in automaton.iter(text):
+                start = end - length + 1
+                if ((start == 0 or not _is_word_char(text[start - 1])) and
+                        (end + 1 == len(text) or not _is_word_char(text[end + 1]))):
+                    return True
+            return False
+
+        return contains
+
+    pattern = re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, phrases)) + r")(?!\w)")
+    return lambda text: pattern.search(text) is not None
+
+
+@lru_cache(maxsize=1024)
+def _class_bit(code: str) -> int:
+    """Bit for a class code ("9" and "009" -> 1 << 9); 0 for anything non-numeric"""
+    return 1 << int(code) if code.isdecimal() and len(code) <= 3 else 0
+
+
+def _class_mask(codes: Iterable[str]) -> int:
+    """Bitmask of class codes, so overlap is an integer AND"""
+    mask = 0
+    for code in codes:
+        mask |= _class_bit(code)
+    return mask
+
+
+# q-gram length for the edit-distance count filter in batch_similarity;
+# bigrams prune better than trigrams on marks this short
+QGRAM_SIZE = 2
+
+
+@lru_cache(maxsize=65536)
+def _qgrams(text: str) -> Counter:
+    """Multiset of text's q-grams (treat as read-only: it is shared)"""
+    return Counter(text[i:i + QGRAM_SIZE] for i in range(len(text) - QGRAM_SIZE + 1))
+
+
+def _edit_similarity_bound(query: str, mark_text: str) -> float:
+    """
+    Upper bound on the edit similarity (0-100) of two normalized strings
+
+    Each edit destroys at most QGRAM_SIZE of the longer string's q-grams
+    (the q-gram count filter), and the length difference must be edited
+    away; together these bound the distance from below without the DP.
+    """
+    max_len = max(len(query), len(mark_text))
+    if max_len == 0:
+        return 100.0
+    common = sum((_qgrams(query) & _qgrams(mark_text)).values())
+    min_edits = max(
+        abs(len(query) - len(mark_text)),
+        -(-(max_len - QGRAM_SIZE + 1 - common) // QGRAM_SIZE)
+    )
+    return (1 - min_edits / max_len) * 100
+
+
+# Result sets overlap heavily across searches, so the same marks are
+# encoded again and again; a hit is much cheaper than re-encoding
+@lru_cache(maxsize=65536)
+def _phonetic_codes(text: str) -> frozenset[str]:
+    """
+    Phonetic codes of a normalized string; two strings sound alike when
+    their codes intersect
+
+    Double Metaphone gives a primary and (possibly empty) alternate code in
+    one pass. The Soundex + Metaphone fallback can't collide with each
+    other (only Soundex codes have digits).
+    """
+    if HAS_DOUBLE_METAPHONE:
+        return frozenset(code for code in doublemetaphone(text) if code)
+    return frozenset((jellyfish.soundex(text), jellyfish.metaphone(text)))
+
+
+# Lower bounds of the MEDIUM, HIGH and CRITICAL bands (see get_risk_level)
+_LEVEL_THRESHOLDS = (40, 70, 90)
+_LEVELS_BY_BAND = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL)
+
 
 class RiskScorer:
     """Calculate risk scores for trademark conflicts"""
@@ -30,7 +195,7 @@ class RiskScorer:
     USE_COMMERCE_WEIGHT = 0.10
 
     # Famous/well-known marks that should automatically be CRITICAL
-    FAMOUS_MARKS = {
+    FAMOUS_MARKS: ClassVar[frozenset[str]] = frozenset({
         # Tech
         "APPLE", "THINK DIFFERENT", "GOOGLE", "MICROSOFT", "AMAZON", "FACEBOOK",
         "META", "INSTAGRAM", "YOUTUBE", "TWITTER", "X", "TESLA", "NETFLIX",
@@ -53,132 +218,298 @@ class RiskScorer:
         # Retail/General
         "WALMART", "TARGET", "COSTCO", "HOME DEPOT", "IKEA", "VISA",
         "MASTERCARD", "AMERICAN EXPRESS", "PAYPAL"
-    }
+    })
+
+    # Famous marks this short only count as exact matches ("X" would
+    # otherwise flag every mark with a standalone X in it)
+    FAMOUS_MIN_CONTAINED_LENGTH = 3
+
+    def __init__(self):
+        self._contains_famous_mark = _phrase_matcher(
+            mark for mark in self.FAMOUS_MARKS if len(mark) >= self.FAMOUS_MIN_CONTAINED_LENGTH
+        )
 
     def is_famous_mark(self, mark_text: str) -> bool:
-        """Check if a trademark is in the famous marks list"""
+        """
+        Check if a trademark is, or contains as whole words, a famous mark
+
+        e.g. "APPLE CIDER INC" matches APPLE; "PINEAPPLE" does not
+        """
         normalized_mark = mark_text.upper().strip()
-        return normalized_mark in self.FAMOUS_MARKS
+        return normalized_mark in self.FAMOUS_MARKS or self._contains_famous_mark(normalized_mark)
+
+    @staticmethod
+    def fingerprint(query: str) -> QueryFingerprint:
+        """Precompute the query side of calculate_similarity_score"""
+        text = query.upper().strip()
+        return QueryFingerprint(text, _phonetic_codes(text) if HAS_PHONETIC else frozenset())
 
     def calculate_risk_score(
         self,
-        query: str,
+        query: Union[str, QueryFingerprint],
         trademark: Trademark,
-        query_classes: List[str] = []
-    ) -> tuple[float, RiskFactors]:
+        query_classes: List[str] = [],
+        similarity_score: Optional[float] = None
+    ) -> tuple[float, RiskFactorsCompact]:
         """
         Calculate overall risk score and individual factor scores
 
         Args:
-            query: The search query (proposed mark)
+            query: The search query (proposed mark), or its fingerprint()
             trademark: Existing trademark to compare against
             query_classes: User's intended international classes
+            similarity_score: Precomputed text similarity (e.g. from batch_similarity);
+                defaults to the one the database search attached, if any
 
         Returns:
-            Tuple of (overall_risk_score, RiskFactors)
+            Tuple of (overall_risk_score, RiskFactorsCompact)
         """
-        # Calculate individual factor scores
-        similarity_score = self.calculate_similarity_score(query, trademark.mark_text)
-        class_overlap_score = self.calculate_class_overlap_score(
-            query_classes,
-            trademark.international_classes,
-            similarity_score=similarity_score
-        )
-        status_strength_score = self.calculate_status_strength_score(trademark)
-        use_commerce_score = self.calculate_use_commerce_score(trademark)
+        risk_factors = self._risk_factors(query, trademark, query_classes, similarity_score)
+        overall_score = self._overall_score(trademark, risk_factors)
+        self._log_breakdown(query, trademark, query_classes, risk_factors, overall_score)
+        return overall_score, risk_factors
+
+    def score_many(
+        self,
+        query: Union[str, QueryFingerprint],
+        trademarks: List[Trademark],
+        query_classes: List[str] = [],
+        similarity_scores: Optional[List[Optional[float]]] = None
+    ) -> List[tuple[float, RiskFactorsCompact]]:
+        """
+        calculate_risk_score for many trademarks against one query
+
+        The weighted sum and famous-mark elevation run as NumPy column
+        operations over all trademarks when NumPy is installed. Terms are
+        added in the same order as calculate_risk_score (not as a matrix
+        product), so scores match it exactly.
+        """
+        if not isinstance(query, QueryFingerprint):
+            query = self.fingerprint(query)
+        if similarity_scores is None:
+            similarity_scores = [None] * len(trademarks)
+        factors = [
+            self._risk_factors(query, trademark, query_classes, similarity)
+            for trademark, similarity in zip(trademarks, similarity_scores)
+        ]
+        if HAS_NUMPY and factors:
+            overall = self._overall_scores(trademarks, factors)
+        else:
+            overall = [self._overall_score(t, f) for t, f in zip(trademarks, factors)]
 
-        # Calculate weighted overall score
+        if logger.isEnabledFor(logging.DEBUG):
+            for t, f, score in zip(trademarks, factors, overall):
+                self._log_breakdown(query, t, query_classes, f, score)
+        return list(zip(overall, factors))
+
+    def _overall_score(self, trademark: Trademark, risk_factors: RiskFactorsCompact) -> float:
+        """Weighted overall score, elevated for famous-mark conflicts"""
         overall_score = (
-            similarity_score * self.SIMILARITY_WEIGHT +
-            class_overlap_score * self.CLASS_OVERLAP_WEIGHT +
-            status_strength_score * self.STATUS_STRENGTH_WEIGHT +
-            use_commerce_score * self.USE_COMMERCE_WEIGHT
+            risk_factors.similarity_score * self.SIMILARITY_WEIGHT +
+            risk_factors.class_overlap_score * self.CLASS_OVERLAP_WEIGHT +
+            risk_factors.status_strength_score * self.STATUS_STRENGTH_WEIGHT +
+            risk_factors.use_commerce_score * self.USE_COMMERCE_WEIGHT
         )
-
-        # Famous mark detection - elevate to CRITICAL if:
-        # 1. The trademark is famous AND
-        # 2. Similarity is high (80+) AND
-        # 3. The mark is registered/active
-        if (self.is_famous_mark(trademark.mark_text) and
-            similarity_score >= 80 and
-            trademark.status == TrademarkStatus.REGISTERED):
-            print(f"   ⚠️  FAMOUS MARK DETECTED: '{trademark.mark_text}' - Auto-elevating to CRITICAL")
+        if self._is_famous_conflict(trademark, risk_factors):
             overall_score = max(overall_score, 95.0)  # Elevate to CRITICAL
+        return overall_score
+
+    def _overall_scores(self, trademarks: List[Trademark], factors: List[RiskFactorsCompact]) -> List[float]:
+        """_overall_score over factor columns"""
+        columns = np.array([
+            (f.similarity_score, f.class_overlap_score, f.status_strength_score, f.use_commerce_score)
+            for f in factors
+        ], dtype=np.float64)
+        overall = (
+            columns[:, 0] * self.SIMILARITY_WEIGHT +
+            columns[:, 1] * self.CLASS_OVERLAP_WEIGHT +
+            columns[:, 2] * self.STATUS_STRENGTH_WEIGHT +
+            columns[:, 3] * self.USE_COMMERCE_WEIGHT
+        )
+        famous = np.fromiter(
+            (self._is_famous_conflict(t, f) for t, f in zip(trademarks, factors)),
+            dtype=bool,
+            count=len(factors)
+        )
+        return np.where(famous, np.maximum(overall, 95.0), overall).tolist()
 
-        # Debug logging
-        print(f"\n🎯 Risk Score Calculation for '{trademark.mark_text}' vs '{query}':")
-        print(f"   Similarity: {similarity_score:.1f}/100 (weight: {self.SIMILARITY_WEIGHT}) = {similarity_score * self.SIMILARITY_WEIGHT:.1f}")
-        print(f"   Class Overlap: {class_overlap_score:.1f}/100 (weight: {self.CLASS_OVERLAP_WEIGHT}) = {class_overlap_score * self.CLASS_OVERLAP_WEIGHT:.1f}")
-        print(f"   Status/Strength: {status_strength_score:.1f}/100 (weight: {self.STATUS_STRENGTH_WEIGHT}) = {status_strength_score * self.STATUS_STRENGTH_WEIGHT:.1f}")
-        print(f"   Use in Commerce: {use_commerce_score:.1f}/100 (weight: {self.USE_COMMERCE_WEIGHT}) = {use_commerce_score * self.USE_COMMERCE_WEIGHT:.1f}")
-        print(f"   Overall Score: {overall_score:.1f}/100 → Risk Level: {self.get_risk_level(overall_score).value.upper()}")
-        print(f"   Trademark Status: {trademark.status.value}")
-        print(f"   Trademark Classes: {trademark.international_classes}")
-        print(f"   Query Classes: {query_classes or 'None specified'}")
-
-        risk_factors = RiskFactors(
+    def _risk_factors(
+        self,
+        query: Union[str, QueryFingerprint],
+        trademark: Trademark,
+        query_classes: List[str],
+        similarity_score: Optional[float]
+    ) -> RiskFactorsCompact:
+        """Individual factor scores of one trademark"""
+        if similarity_score is None:
+            similarity_score = trademark._similarity_score
+        if similarity_score is None:
+            similarity_score = self.calculate_similarity_score(query, trademark.mark_text)
+        return RiskFactorsCompact(
             similarity_score=similarity_score,
-            class_overlap_score=class_overlap_score,
-            status_strength_score=status_strength_score,
-            use_commerce_score=use_commerce_score
+            class_overlap_score=self.calculate_class_overlap_score(
+                query_classes,
+                trademark.international_classes,
+                similarity_score=similarity_score
+            ),
+            status_strength_score=self.calculate_status_strength_score(trademark),
+            use_commerce_score=self.calculate_use_commerce_score(trademark)
         )
 
-        return overall_score, risk_factors
-
-    def calculate_similarity_score(self, query: str, mark_text: str) -> float:
+    def _is_famous_conflict(self, trademark: Trademark, risk_factors: RiskFactorsCompact) -> bool:
+        """
+        Famous mark detection - elevate to CRITICAL if:
+        1. The trademark is famous AND
+        2. Similarity is high (80+) AND
+        3. The mark is registered/active
+        """
+        if (risk_factors.similarity_score >= 80 and
+            trademark.status is TrademarkStatus.REGISTERED and
+            self.is_famous_mark(trademark.mark_text)):
+            logger.info("Famous mark detected: %r - elevating to CRITICAL", trademark.mark_text)
+            return True
+        return False
+
+    def _log_breakdown(
+        self,
+        query: Union[str, QueryFingerprint],
+        trademark: Trademark,
+        query_classes: List[str],
+        risk_factors: RiskFactorsCompact,
+        overall_score: float
+    ) -> None:
+        # Called once per result, so skip building the breakdown unless it's wanted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Risk score for %r vs %r: similarity=%.1f class_overlap=%.1f "
+                "status_strength=%.1f use_commerce=%.1f overall=%.1f (%s) "
+                "status=%s classes=%s query_classes=%s",
+                trademark.mark_text,
+                query.text if isinstance(query, QueryFingerprint) else query,
+                risk_factors.similarity_score, risk_factors.class_overlap_score,
+                risk_factors.status_strength_score, risk_factors.use_commerce_score,
+                overall_score, self.get_risk_level(overall_score).value,
+                trademark.status.value, trademark.international_classes,
+                query_classes or "none"
+            )
+
+    def calculate_similarity_score(self, query: Union[str, QueryFingerprint], mark_text: str) -> float:
         """
         Calculate text similarity score (0-100)
 
         Uses multiple algorithms:
         - Levenshtein distance (edit distance) - if available
-        - Soundex (phonetic similarity) - if available
-        - Metaphone (phonetic similarity) - if available
+        - Double Metaphone, or Soundex + Metaphone (phonetic similarity) - if available
         - Basic string comparison (fallback)
+
+        Pass fingerprint(query) when scoring many marks against one query.
         """
-        query = query.upper().strip()
+        if not isinstance(query, QueryFingerprint):
+            query = self.fingerprint(query)
         mark_text = mark_text.upper().strip()
 
         # Exact match
-        if query == mark_text:
+        if query.text == mark_text:
             return 100.0
 
-        scores = []
+        return self._combine_similarity(query, mark_text)
 
-        # Levenshtein similarity (normalized)
-        if HAS_LEVENSHTEIN:
-            lev_distance = Levenshtein.distance(query, mark_text)
-            max_len = max(len(query), len(mark_text))
-            lev_similarity = (1 - lev_distance / max_len) * 100 if max_len > 0 else 0
-            scores.append(lev_similarity)
+    def batch_similarity(self, query: str, mark_texts: List[str]) -> List[float]:
+        """
+        Calculate calculate_similarity_score for many marks at once
+
+        Phonetic and containment scores come first; marks whose q-gram
+        bound (_edit_similarity_bound) shows edit distance cannot beat them
+        skip it entirely. The rest get edit distance in one native call:
+        rapidfuzz's process.cdist when available, otherwise each mark is
+        scored individually. Results are identical to
+        calculate_similarity_score.
+        """
+        fingerprint = self.fingerprint(query)
+        query = fingerprint.text
+        marks = [m.upper().strip() for m in mark_texts]
+        scores = [
+            100.0 if m == query else self._phonetic_similarity(fingerprint, m)
+            for m in marks
+        ]
+
+        pending = [
+            i for i, m in enumerate(marks)
+            if scores[i] < 100.0 and _edit_similarity_bound(query, m) > scores[i]
+        ]
+        pending_marks = [marks[i] for i in pending]
+
+        if HAS_RAPIDFUZZ and HAS_NUMPY and pending_marks:
+            # Single-threaded: for a few hundred short marks, workers=-1
+            # costs more in thread startup than it saves
+            edit_scores = process.cdist(
+                [query], pending_marks, scorer=Levenshtein.normalized_similarity, dtype=np.float64
+            )[0] * 100
         else:
-            # Fallback: simple character-based similarity
-            max_len = max(len(query), len(mark_text))
-            if max_len > 0:
-                matching_chars = sum(1 for a, b in zip(query, mark_text) if a == b)
-                simple_similarity = (matching_chars / max_len) * 100
-                scores.append(simple_similarity)
-
-        # Phonetic similarity (Soundex)
-        if HAS_JELLYFISH:
-            soundex_match = jellyfish.soundex(query) == jellyfish.soundex(mark_text)
-            soundex_score = 80.0 if soundex_match else 0.0
-            scores.append(soundex_score)
-
-            # Phonetic similarity (Metaphone)
-            metaphone_match = jellyfish.metaphone(query) == jellyfish.metaphone(mark_text)
-            metaphone_score = 80.0 if metaphone_match else 0.0
-            scores.append(metaphone_score)
+            edit_scores = [self._edit_similarity(query, m) for m in pending_marks]
 
-        # Check if one contains the other
-        contains_score = 0.0
-        if query in mark_text or mark_text in query:
-            contains_score = 70.0
-        scores.append(contains_score)
+        for i, edit in zip(pending, edit_scores):
+            scores[i] = min(max(scores[i], float(edit)), 100.0)
+        return scores
+
+    def _edit_similarity(self, query: str, mark_text: str, score_cutoff: float = 0.0) -> float:
+        """
+        Normalized edit-distance similarity (0-100) of two normalized strings
+
+        Scores at or below score_cutoff may come back as 0: the caller only
+        needs the edit similarity when it beats its other scores.
+        """
+        max_len = max(len(query), len(mark_text))
+        if max_len == 0:
+            return 0.0
+
+        # At least max_len - min_len edits are needed, so the similarity can
+        # be no higher than min_len / max_len; skip the DP when that loses
+        if score_cutoff and min(len(query), len(mark_text)) / max_len * 100 <= score_cutoff:
+            return 0.0
+
+        # Levenshtein similarity, 1 - distance / max_len (bit-parallel in rapidfuzz)
+        if HAS_RAPIDFUZZ:
+            return Levenshtein.normalized_similarity(
+                query, mark_text, score_cutoff=score_cutoff / 100
+            ) * 100
+
+        # Fallback: simple character-based similarity
+        matching_chars = sum(1 for a, b in zip(query, mark_text) if a == b)
+        return (matching_chars / max_len) * 100
+
+    def _combine_similarity(
+        self,
+        query: QueryFingerprint,
+        mark_text: str,
+        edit_similarity: Optional[float] = None
+    ) -> float:
+        """
+        Combine edit-distance, phonetic and containment scores
 
-        # Take the maximum score from all methods
-        similarity_score = max(scores) if scores else 0.0
+        The edit similarity is computed here (if not given) only after the
+        cheaper scores, and only as far as it could still be the maximum.
+        """
+        # Running maximum of the method scores
+        best = self._phonetic_similarity(query, mark_text)
+
+        if edit_similarity is None:
+            edit_similarity = self._edit_similarity(query.text, mark_text, score_cutoff=best)
+        if edit_similarity > best:
+            best = edit_similarity
 
-        return min(similarity_score, 100.0)
+        return min(best, 100.0)
+
+    def _phonetic_similarity(self, query: QueryFingerprint, mark_text: str) -> float:
+        """Best of the phonetic and containment scores (everything but edit distance)"""
+        # Phonetic similarity (any shared code)
+        if HAS_PHONETIC and not query.phonetic_codes.isdisjoint(_phonetic_codes(mark_text)):
+            return 80.0
+
+        # Check if one contains the other
+        if query.text in mark_text or mark_text in query.text:
+            return 70.0
+        return 0.0
 
     def calculate_class_overlap_score(
         self,
@@ -207,16 +538,15 @@ class RiskScorer:
 
         # If user specified classes, calculate actual overlap
         if query_classes:
-            # Normalize class numbers (pad to 3 digits)
-            normalized_query = {c.zfill(3) for c in query_classes}
-            normalized_mark = {c.zfill(3) for c in mark_classes}
+            # Normalize class numbers (bit n for class n, however it's padded)
+            query_mask = _class_mask(query_classes)
 
             # Calculate overlap
-            overlap = normalized_query & normalized_mark
+            overlap = query_mask & _class_mask(mark_classes)
 
             if overlap:
                 # Same class = 100% risk
-                overlap_ratio = len(overlap) / len(normalized_query)
+                overlap_ratio = overlap.bit_count() / query_mask.bit_count()
                 return min(100.0, 80.0 + (overlap_ratio * 20.0))
             else:
                 # Different classes = lower risk
@@ -265,13 +595,19 @@ class RiskScorer:
         - Market presence
         - Famous mark status
         """
-        if trademark.status == TrademarkStatus.REGISTERED:
+        if trademark.status is TrademarkStatus.REGISTERED:
             return 80.0
-        elif trademark.status == TrademarkStatus.PENDING:
+        elif trademark.status is TrademarkStatus.PENDING:
             return 50.0
         else:
             return 20.0
 
+    def get_risk_levels(self, risk_scores: List[float]) -> List[RiskLevel]:
+        """get_risk_level for many scores (one np.digitize when NumPy is available)"""
+        if not HAS_NUMPY:
+            return [self.get_risk_level(score) for score in risk_scores]
+        return [_LEVELS_BY_BAND[band] for band in np.digitize(risk_scores, _LEVEL_THRESHOLDS).tolist()]
+
     def get_risk_level(self, risk_score: float) -> RiskLevel:
         """Convert numeric risk score to RiskLevel enum"""
         if risk_score >= 90:
@@ -287,7 +623,7 @@ class RiskScorer:
         self,
         query: str,
         trademark: Trademark,
-        risk_factors: RiskFactors
+        risk_factors: RiskFactorsCompact | RiskFactors
     ) -> str:
         """Generate human-readable explanation of conflict risk"""
         reasons = []
@@ -299,9 +635,9 @@ class RiskScorer:
             reasons.append(f"Similar to '{trademark.mark_text}'")
 
         # Status
-        if trademark.status == TrademarkStatus.REGISTERED:
+        if trademark.status is TrademarkStatus.REGISTERED:
             reasons.append("Active registered trademark")
-        elif trademark.status == TrademarkStatus.PENDING:
+        elif trademark.status is TrademarkStatus.PENDING:
             reasons.append("Pending application")
 
         # Classes
@@ -312,3 +648,4 @@ class RiskScorer:
             reasons.append("Potential similarity detected")
 
         return "; ".join(reasons)
+
@@ -0,0 +1,131 @@
+"""
+SQLite-backed cache for per-trademark risk scores
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from app.models.trademark import Trademark
+from app.services.risk_scorer import SCORER_VERSION
+
+# (risk_score, risk_factors as dict, conflict_reason)
+CachedScore = Tuple[float, dict, str]
+
+
+class ScorerCache:
+    """
+    Persistent cache of risk scoring results
+
+    Scoring is deterministic for a given scorer version, query, query
+    classes and trademark record, so results are keyed on exactly those
+    inputs. Any change to the fields the scorer reads (e.g. classes filled
+    in by TSDR enrichment) produces a new key, as does a SCORER_VERSION bump
+    or a change in where the text similarity came from; stale rows also age
+    out after ttl_seconds.
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: int = 86400):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+        # Shared by the event loop and scoring worker threads (guarded by _lock);
+        # WAL lets several uvicorn workers read while one writes.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS risk_scores (
+                key TEXT PRIMARY KEY,
+                risk_score REAL NOT NULL,
+                risk_factors TEXT NOT NULL,
+                conflict_reason TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(query: str, query_classes: Iterable[str], trademark: Trademark) -> str:
+        """Build a cache key from every input that affects the risk score"""
+        parts = [
+            str(SCORER_VERSION),
+            # Similarity computed by the database search vs. by RiskScorer
+            "db" if trademark._similarity_score is not None else "py",
+            query.casefold().strip(),
+            ",".join(sorted(query_classes)),
+            trademark.serial_number,
+            trademark.mark_text,
+            trademark.status.value if trademark.status else "",
+            ",".join(trademark.international_classes),
+        ]
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedScore]:
+        """Return a cached score or None on miss/expiry"""
+        return self.get_many([key]).get(key)
+
+    def put(self, key: str, value: CachedScore) -> None:
+        """Store a single score"""
+        self.put_many([(key, value)])
+
+    def get_many(self, keys: List[str]) -> Dict[str, CachedScore]:
+        """Look up several keys in one query"""
+        if not keys:
+            return {}
+
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT key, risk_score, risk_factors, conflict_reason
+                FROM risk_scores
+                WHERE key IN ({placeholders}) AND expires_at > ?
+                """,
+                (*keys, time.time())
+            ).fetchall()
+
+        return {
+            key: (risk_score, json.loads(risk_factors), conflict_reason)
+            for key, risk_score, risk_factors, conflict_reason in rows
+        }
+
+    def put_many(self, items: List[Tuple[str, CachedScore]]) -> None:
+        """Store several scores in a single transaction"""
+        if not items:
+            return
+
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO risk_scores
+                    (key, risk_score, risk_factors, conflict_reason, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (key, risk_score, json.dumps(risk_factors), conflict_reason, expires_at)
+                    for key, (risk_score, risk_factors, conflict_reason) in items
+                ]
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete expired rows, returning how many were removed"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM risk_scores WHERE expires_at <= ?",
+                (time.time(),)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
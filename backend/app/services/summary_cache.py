@@ -0,0 +1,83 @@
+"""
+Cache for AI-generated search summaries
+"""
+from typing import List, Optional
+import hashlib
+import sqlite3
+import threading
+import time
+
+from app.models.risk import TrademarkRiskAnalysis, SearchResultsSummary
+
+
+class SummaryCache:
+    """
+    Persistent cache of SearchResultsSummary objects
+
+    Keyed on the normalized query plus a fingerprint of the scored results,
+    so an identical search never pays for a second Claude call. Only exact
+    matches are served: the summary's findings and recommendations name the
+    specific marks it was written for.
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: int = 86400):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(query: str, risk_analyses: List[TrademarkRiskAnalysis]) -> str:
+        """Canonical key: normalized query + sorted serial:score pairs"""
+        fingerprint = ",".join(sorted(
+            f"{ra.serial_number}:{round(ra.risk_score)}" for ra in risk_analyses
+        ))
+        return hashlib.sha256(f"{query.casefold().strip()}|{fingerprint}".encode("utf-8")).hexdigest()
+
+    def get(self, query: str, risk_analyses: List[TrademarkRiskAnalysis]) -> Optional[SearchResultsSummary]:
+        """Return the cached summary for this query/results combination, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary FROM summaries WHERE key = ? AND expires_at > ?",
+                (self.make_key(query, risk_analyses), time.time())
+            ).fetchone()
+        return SearchResultsSummary.model_validate_json(row[0]) if row else None
+
+    def put(
+        self,
+        query: str,
+        risk_analyses: List[TrademarkRiskAnalysis],
+        summary: SearchResultsSummary
+    ) -> None:
+        """Store a summary for this query/results combination"""
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO summaries (key, summary, expires_at)
+                VALUES (?, ?, ?)
+                """,
+                (
+                    self.make_key(query, risk_analyses),
+                    summary.model_dump_json(),
+                    time.time() + self.ttl_seconds
+                )
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
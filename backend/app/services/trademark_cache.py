@@ -0,0 +1,64 @@
+"""
+Redis cache for trademark detail lookups
+"""
+from typing import Optional
+import logging
+import orjson
+
+# Optional dependency - detail lookups go straight to the source without it
+try:
+    import redis.asyncio as aioredis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+from app.models.trademark import Trademark
+
+logger = logging.getLogger(__name__)
+
+
+class TrademarkCache:
+    """
+    Caches serialized Trademark JSON by serial number
+
+    Records are near-static, so hits are served as the stored bytes without
+    touching PostgreSQL/TSDR or re-validating the model. Unknown serials are
+    remembered briefly (negative_ttl_seconds) so repeated 404s stay cheap.
+    Redis errors are logged and treated as a miss.
+    """
+
+    NOT_FOUND = b"null"
+
+    def __init__(self, redis_url: str, ttl_seconds: int = 86400, negative_ttl_seconds: int = 60):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._redis = aioredis.from_url(redis_url)
+
+    @staticmethod
+    def _key(serial_number: str) -> str:
+        return f"trademark:{serial_number}"
+
+    async def get(self, serial_number: str) -> Optional[bytes]:
+        """Return cached JSON bytes, NOT_FOUND for a cached 404, or None on miss"""
+        try:
+            return await self._redis.get(self._key(serial_number))
+        except Exception as e:
+            logger.warning("Trademark cache read failed: %s", e)
+            return None
+
+    async def set(self, serial_number: str, trademark: Optional[Trademark]) -> Optional[bytes]:
+        """Cache a trademark (or its absence) and return the stored bytes"""
+        if trademark is None:
+            payload, ttl = self.NOT_FOUND, self.negative_ttl_seconds
+        else:
+            payload, ttl = orjson.dumps(trademark.model_dump(mode="json")), self.ttl_seconds
+
+        try:
+            await self._redis.set(self._key(serial_number), payload, ex=ttl)
+        except Exception as e:
+            logger.warning("Trademark cache write failed: %s", e)
+        return payload
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool"""
+        await self._redis.aclose()
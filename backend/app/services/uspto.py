@@ -1,19 +1,127 @@
 """
 USPTO API Client - Uses RapidAPI for real-time trademark searches
 """
+import asyncio
 import httpx
-from typing import List, Optional
+import logging
+import orjson
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Optional
 import xml.etree.ElementTree as ET
-from datetime import datetime
+from datetime import date, datetime
+from io import BytesIO
+
+# Optional C-backed streaming XML parser (ElementTree fallback)
+try:
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# Optional Brotli decoder; httpx only decodes "br" responses when it is installed
+try:
+    import brotli  # noqa: F401
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
 
 from app.config import settings
 from app.models.trademark import Trademark, TrademarkStatus
 
+logger = logging.getLogger(__name__)
+
+# Search pages at least this long are parsed in a worker thread
+_THREADED_PARSE_MIN_ITEMS = 200
+
+# RapidAPI status strings (upper-cased) to TrademarkStatus; anything else is UNKNOWN
+_STATUS_STRING_MAP = MappingProxyType({
+    "REGISTERED": TrademarkStatus.REGISTERED,
+    "REG": TrademarkStatus.REGISTERED,
+    "LIVE": TrademarkStatus.REGISTERED,
+    "PENDING": TrademarkStatus.PENDING,
+    "PUB": TrademarkStatus.PENDING,
+    "PUBLISHED": TrademarkStatus.PENDING,
+    "ABANDONED": TrademarkStatus.ABANDONED,
+    "DEAD": TrademarkStatus.ABANDONED,
+    "CANCELLED": TrademarkStatus.CANCELLED,
+    "CANCELED": TrademarkStatus.CANCELLED,
+    "EXPIRED": TrademarkStatus.EXPIRED,
+})
+
+# TSDR MarkCurrentStatusCode values (upper-cased) to TrademarkStatus
+_TSDR_STATUS_MAP = MappingProxyType({
+    "REGISTERED": TrademarkStatus.REGISTERED,
+    "NEW APPLICATION FILED": TrademarkStatus.PENDING,
+    "ABANDONED": TrademarkStatus.ABANDONED,
+    "CANCELLED": TrademarkStatus.CANCELLED,
+    "EXPIRED": TrademarkStatus.EXPIRED,
+})
+
+# Class codes as they arrive (int, or str padded to any width up to 3) to
+# the zero-padded 3-digit form, e.g. 9 / "9" / "09" -> "009". A plain dict:
+# .get() through a MappingProxyType costs more than the zfill it replaces
+_CLASS_CODES = {
+    key: f"{i:03d}"
+    for i in range(1000)
+    for key in (i, str(i), f"{i:02d}", f"{i:03d}")
+}
+
+
+def _format_class(code) -> str:
+    """Zero-pad a class code to 3 digits (one dict hit for numeric codes)"""
+    return _CLASS_CODES.get(code) or str(code).zfill(3)
+
+
+# XML namespaces used by USPTO TSDR API
+TSDR_NAMESPACES = {
+    'ns1': 'http://www.wipo.int/standards/XMLSchema/ST96/Common',
+    'ns2': 'http://www.wipo.int/standards/XMLSchema/ST96/Trademark'
+}
+
+# Element holding each single-valued TSDR field (first match wins)
+TSDR_PATHS = {
+    "serial_number": ".//ns1:ApplicationNumberText",
+    "registration_number": ".//ns1:RegistrationNumber",
+    "mark_text": ".//ns2:MarkVerbalElementText",
+    "owner_name": ".//ns1:OrganizationStandardName",
+    "status": ".//ns2:MarkCurrentStatusCode",
+    "filing_date": ".//ns2:ApplicationDate",
+    "registration_date": ".//ns1:RegistrationDate",
+    "goods_services_description": ".//ns2:GoodsServicesDescriptionText",
+}
+
+
+def _clark(path: str) -> str:
+    """'.//ns1:Local' -> '{namespace-uri}Local' (the tag name lxml reports)"""
+    prefix, local = path.rsplit("/", 1)[-1].split(":")
+    return f"{{{TSDR_NAMESPACES[prefix]}}}{local}"
+
+
+# TSDR_PATHS fields by the tag iterparse reports for them, plus the element
+# each Nice class sits in
+_TSDR_FIELD_BY_TAG = {_clark(path): field for field, path in TSDR_PATHS.items()}
+_TSDR_CLASSIFICATION_TAG = _clark(".//ns2:GoodsServicesClassification")
+_TSDR_TAGS = (*_TSDR_FIELD_BY_TAG, _TSDR_CLASSIFICATION_TAG)
+
+# The same paths with namespaces already expanded, so .find() needs no
+# prefix map (whose items ElementPath sorts into its cache key on every call)
+_TSDR_FIND_PATHS = {field: f".//{_clark(path)}" for field, path in TSDR_PATHS.items()}
+_CLASSIFICATION_PATH = f".//{_TSDR_CLASSIFICATION_TAG}"
+_KIND_CODE_PATH = f".//{_clark('.//ns2:ClassificationKindCode')}"
+_CLASS_NUMBER_PATH = f".//{_clark('.//ns2:ClassNumber')}"
+
 
 class USPTOClient:
     """Client for USPTO Trademark Database via RapidAPI"""
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 4096, cache_ttl_seconds: float = 3600):
+        """
+        Args:
+            cache_size: TSDR lookups kept in memory by get_trademark_by_serial
+            cache_ttl_seconds: How long a cached lookup is reused (0 disables)
+        """
         # RapidAPI credentials for trademark search
         self.rapidapi_key = settings.RAPIDAPI_KEY
         self.rapidapi_host = settings.RAPIDAPI_HOST
@@ -27,9 +135,29 @@ class USPTOClient:
         self.tsdr_url = settings.USPTO_TSDR_URL
         self.tsdr_headers = {
             "USPTO-API-KEY": self.tsdr_api_key,
-            "Accept": "application/json"
+            "Accept": "application/json",
+            # TSDR XML is highly redundant markup; httpx decompresses transparently
+            "Accept-Encoding": "gzip, br" if HAS_BROTLI else "gzip"
         }
 
+        # Shared connection pool: keep-alive + HTTP/2 multiplexing across lookups
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        )
+
+        # TSDR records barely change within a session: serial -> (expires_at, Trademark)
+        self.cache_size = cache_size
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._serial_cache: OrderedDict = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    async def aclose(self):
+        """Close the shared HTTP connection pool"""
+        await self._client.aclose()
+
     async def search_trademarks(self, query: str, limit: int = 50) -> List[Trademark]:
         """
         Search for trademarks using RapidAPI
@@ -41,76 +169,81 @@ class USPTOClient:
         Returns:
             List of Trademark objects
         """
-        print(f"\n🔍 RapidAPI search for '{query}' (limit: {limit})")
+        logger.debug("RapidAPI search for %r (limit: %d)", query, limit)
 
         url = f"https://{self.rapidapi_host}/v1/trademarkSearch/{query}"
         params = {"searchKeyword": query}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(
-                    url,
-                    headers=self.rapidapi_headers,
-                    params=params
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                if not data or "items" not in data:
-                    print(f"   No results found")
-                    return []
-
-                # Parse results
-                trademarks = []
-                items = data["items"][:limit]  # Limit results
-
-                print(f"   Found {len(items)} results from RapidAPI")
-
-                for item in items:
-                    trademark = self._parse_rapidapi_result(item)
-                    if trademark:
-                        trademarks.append(trademark)
-
-                print(f"✅ Parsed {len(trademarks)} valid trademarks")
-                return trademarks
-
-            except httpx.HTTPStatusError as e:
-                print(f"❌ HTTP error searching RapidAPI: {e}")
-                print(f"   Response: {e.response.text if hasattr(e, 'response') else 'N/A'}")
-                return []
-            except Exception as e:
-                print(f"❌ Error searching RapidAPI: {e}")
+        try:
+            response = await self._client.get(
+                url,
+                headers=self.rapidapi_headers,
+                params=params
+            )
+            response.raise_for_status()
+            # orjson decodes the raw body several times faster than response.json()
+            data = orjson.loads(response.content)
+
+            if not data or "items" not in data:
+                logger.debug("No RapidAPI results for %r", query)
                 return []
 
-    def _parse_rapidapi_result(self, item: dict) -> Optional[Trademark]:
-        """Parse RapidAPI search result into Trademark model"""
+            items = data["items"][:limit]  # Limit results
+            if len(items) >= _THREADED_PARSE_MIN_ITEMS:
+                # Large pages are enough CPU work to stall other requests
+                trademarks = await asyncio.to_thread(self._parse_rapidapi_items, items)
+            else:
+                trademarks = self._parse_rapidapi_items(items)
+
+            logger.debug("Parsed %d/%d RapidAPI results for %r", len(trademarks), len(items), query)
+            return trademarks
+
+        except httpx.HTTPStatusError as e:
+            logger.error("HTTP error searching RapidAPI: %s (response: %s)", e, e.response.text)
+            return []
+        except Exception:
+            logger.exception("Error searching RapidAPI for %r", query)
+            return []
+
+    def _parse_rapidapi_items(self, items: List[dict]) -> List[Trademark]:
+        """Parse RapidAPI search items, dropping any that fail to parse"""
+        # map() binds the parser once and lets the list grow in C
+        return [t for t in map(self._parse_rapidapi_result, items) if t is not None]
+
+    def _parse_rapidapi_result(self, item: dict, validate: bool = False) -> Optional[Trademark]:
+        """
+        Parse RapidAPI search result into Trademark model
+
+        Every field is already coerced here, so the model is built with
+        model_construct unless validate=True asks for full pydantic checks
+        or a required field came back null.
+        """
         try:
-            # Extract fields from RapidAPI response
-            serial_number = item.get("serialNumber", "")
-            registration_number = item.get("registrationNumber")
-            mark_text = item.get("markIdentification", "")
-            owner_name = item.get("ownerName", "Unknown")
-
-            # Parse status
-            status_text = item.get("status", "")
-            status = self._parse_status_string(status_text)
-
-            # Parse dates
-            filing_date = self._parse_date(item.get("filingDate"))
-            registration_date = self._parse_date(item.get("registrationDate"))
-
-            # Parse international classes
-            classes_raw = item.get("internationalClasses", [])
-            classes = []
-            if isinstance(classes_raw, list):
-                classes = [str(c).zfill(3) for c in classes_raw if c]
-            elif isinstance(classes_raw, str):
-                classes = [c.strip().zfill(3) for c in classes_raw.split(",") if c.strip()]
-
-            # Goods/services description
-            goods_services = item.get("goodsAndServices")
-
-            return Trademark(
+            # Bind .get once; every field below is a single lookup
+            get = item.get
+            serial_number = get("serialNumber", "")
+            registration_number = get("registrationNumber")
+            mark_text = get("markIdentification", "")
+            owner_name = get("ownerName", "Unknown")
+            status = self._parse_status_string(get("status", ""))
+            filing_date = self._parse_date(get("filingDate"))
+            registration_date = self._parse_date(get("registrationDate"))
+            goods_services = get("goodsAndServices")
+
+            # Parse international classes (list or comma-separated string)
+            classes_raw = get("internationalClasses")
+            kind = type(classes_raw)
+            if kind is list:
+                classes = [_format_class(c) for c in classes_raw if c]
+            elif kind is str:
+                classes = [_format_class(c) for c in map(str.strip, classes_raw.split(",")) if c]
+            else:
+                classes = []
+
+            # Null required fields still go through (and fail) validation
+            checked = validate or serial_number is None or mark_text is None
+            build = Trademark if checked else Trademark.model_construct
+            return build(
                 serial_number=serial_number,
                 registration_number=registration_number,
                 mark_text=mark_text,
@@ -123,28 +256,15 @@ class USPTOClient:
             )
 
         except Exception as e:
-            print(f"Error parsing RapidAPI result: {e}")
+            logger.warning("Error parsing RapidAPI result: %s", e)
             return None
 
     def _parse_status_string(self, status_str: str) -> TrademarkStatus:
         """Map status string to TrademarkStatus enum"""
         if not status_str:
             return TrademarkStatus.UNKNOWN
-
-        status_map = {
-            "REGISTERED": TrademarkStatus.REGISTERED,
-            "REG": TrademarkStatus.REGISTERED,
-            "LIVE": TrademarkStatus.REGISTERED,
-            "PENDING": TrademarkStatus.PENDING,
-            "PUB": TrademarkStatus.PENDING,
-            "PUBLISHED": TrademarkStatus.PENDING,
-            "ABANDONED": TrademarkStatus.ABANDONED,
-            "DEAD": TrademarkStatus.ABANDONED,
-            "CANCELLED": TrademarkStatus.CANCELLED,
-            "CANCELED": TrademarkStatus.CANCELLED,
-            "EXPIRED": TrademarkStatus.EXPIRED,
-        }
-        return status_map.get(status_str.upper(), TrademarkStatus.UNKNOWN)
+        # Statuses usually arrive upper-case already; only upper() the rest
+        return _STATUS_STRING_MAP.get(status_str) or _STATUS_STRING_MAP.get(status_str.upper(), TrademarkStatus.UNKNOWN)
 
     async def get_trademark_by_serial(self, serial_number: str) -> Optional[Trademark]:
         """
@@ -156,94 +276,237 @@ class USPTOClient:
         Returns:
             Trademark object or None
         """
-        print(f"📡 Fetching trademark {serial_number} from TSDR API...")
-        return await self._fetch_from_tsdr(serial_number)
+        caching = self.cache_ttl_seconds > 0 and self.cache_size > 0
+        if caching:
+            entry = self._serial_cache.get(serial_number)
+            if entry is not None and entry[0] >= time.monotonic():
+                self._serial_cache.move_to_end(serial_number)
+                self._cache_hits += 1
+                return entry[1]
+            self._cache_misses += 1
+
+        logger.debug("Fetching trademark %s from TSDR API", serial_number)
+        trademark = await self._fetch_from_tsdr(serial_number)
+
+        # Only successful lookups are kept; failures may be transient
+        if caching and trademark is not None:
+            self._serial_cache[serial_number] = (time.monotonic() + self.cache_ttl_seconds, trademark)
+            self._serial_cache.move_to_end(serial_number)
+            if len(self._serial_cache) > self.cache_size:
+                self._serial_cache.popitem(last=False)
+        return trademark
+
+    def cache_info(self) -> Dict[str, int]:
+        """Hit/miss counters and current size of the TSDR lookup cache"""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._serial_cache),
+            "maxsize": self.cache_size,
+        }
+
+    async def get_trademarks_by_serial(
+        self,
+        serial_numbers: List[str],
+        max_concurrency: int = 10
+    ) -> List[Optional[Trademark]]:
+        """
+        Get many trademarks from TSDR concurrently
+
+        Lookups share the client's connection pool (multiplexed over HTTP/2)
+        and at most max_concurrency are in flight, to stay within USPTO rate
+        limits. Results are in input order; failed lookups are None.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(serial_number: str) -> Optional[Trademark]:
+            async with semaphore:
+                return await self.get_trademark_by_serial(serial_number)
+
+        return await asyncio.gather(*(fetch(s) for s in serial_numbers))
+
+    async def hydrate(self, trademarks: List[Trademark], max_concurrency: int = 10) -> int:
+        """
+        Fill owner, classes and goods/services from TSDR in place
+
+        All lookups run concurrently through get_trademarks_by_serial, so the
+        step costs roughly one TSDR round-trip instead of one per trademark.
+        Failed lookups leave their trademark untouched.
+
+        Returns:
+            Number of trademarks that received TSDR details
+        """
+        results = await self.get_trademarks_by_serial(
+            [t.serial_number for t in trademarks],
+            max_concurrency=max_concurrency
+        )
+
+        hydrated = 0
+        for trademark, details in zip(trademarks, results):
+            if details is None:
+                continue
+
+            if details.owner_name and details.owner_name != "Unknown":
+                trademark.owner_name = details.owner_name
+            if details.international_classes:
+                trademark.international_classes = list(details.international_classes)
+            if details.goods_services_description:
+                trademark.goods_services_description = details.goods_services_description
+            hydrated += 1
+
+        return hydrated
+
+    async def search_and_hydrate(
+        self,
+        query: str,
+        limit: int = 50,
+        max_concurrency: int = 10
+    ) -> List[Trademark]:
+        """
+        Search RapidAPI, then fill in TSDR details for every hit concurrently
+
+        Args:
+            query: Search term (trademark name)
+            limit: Maximum number of results
+            max_concurrency: Cap on in-flight TSDR lookups
+
+        Returns:
+            List of Trademark objects
+        """
+        trademarks = await self.search_trademarks(query, limit)
+        if trademarks:
+            hydrated = await self.hydrate(trademarks, max_concurrency)
+            logger.debug("Hydrated %d/%d results for %r from TSDR", hydrated, len(trademarks), query)
+        return trademarks
 
     async def _fetch_from_tsdr(self, serial_number: str) -> Optional[Trademark]:
         """Fetch trademark from TSDR API"""
         url = f"{self.tsdr_url}/sn{serial_number}/info.xml"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(url, headers=self.tsdr_headers)
-                response.raise_for_status()
-                trademark = self._parse_tsdr_xml(response.text)
-                return trademark
-            except httpx.HTTPStatusError as e:
-                print(f"HTTP error getting trademark {serial_number}: {e}")
-                return None
-            except Exception as e:
-                print(f"Error getting trademark {serial_number}: {e}")
-                return None
-
-    def _parse_tsdr_xml(self, xml_content: str) -> Optional[Trademark]:
-        """Parse TSDR XML response into Trademark model"""
         try:
-            root = ET.fromstring(xml_content)
+            response = await self._client.get(url, headers=self.tsdr_headers)
+            response.raise_for_status()
+            trademark = self._parse_tsdr_xml(response.content)
+            return trademark
+        except httpx.HTTPStatusError as e:
+            logger.warning("HTTP error getting trademark %s: %s", serial_number, e)
+            return None
+        except Exception:
+            logger.exception("Error getting trademark %s", serial_number)
+            return None
 
-            # Define XML namespaces used by USPTO TSDR API
-            ns = {
-                'ns1': 'http://www.wipo.int/standards/XMLSchema/ST96/Common',
-                'ns2': 'http://www.wipo.int/standards/XMLSchema/ST96/Trademark'
-            }
+    def _parse_tsdr_xml(self, xml_bytes: bytes, validate: bool = False) -> Optional[Trademark]:
+        """
+        Parse TSDR XML response into Trademark model
+
+        Skips pydantic validation (model_construct) unless validate=True or a
+        required field is missing, in which case the validating constructor
+        raises and the document is rejected as before.
+        """
+        try:
+            # Parsed straight from the raw body: the XML declaration names the
+            # encoding, so there is no str decode/re-encode round trip
+            if HAS_LXML:
+                text, classes = self._scan_tsdr(xml_bytes)
+            else:
+                root = ET.fromstring(xml_bytes)
+                text, classes = self._get_xml_texts(root), self._get_classes(root)
 
             # Extract trademark data from XML
             trademark_data = {
-                "serial_number": self._get_xml_text(root, ".//ns1:ApplicationNumberText", ns),
-                "registration_number": self._get_xml_text(root, ".//ns1:RegistrationNumber", ns),
-                "mark_text": self._get_xml_text(root, ".//ns2:MarkVerbalElementText", ns),
-                "owner_name": self._get_xml_text(root, ".//ns1:OrganizationStandardName", ns) or "Unknown",
-                "status": self._parse_status(self._get_xml_text(root, ".//ns2:MarkCurrentStatusCode", ns)),
-                "filing_date": self._parse_date(self._get_xml_text(root, ".//ns2:ApplicationDate", ns)),
-                "registration_date": self._parse_date(self._get_xml_text(root, ".//ns1:RegistrationDate", ns)),
-                "international_classes": self._get_classes(root, ns),
-                "goods_services_description": self._get_xml_text(root, ".//ns2:GoodsServicesDescriptionText", ns),
+                "serial_number": text.get("serial_number"),
+                "registration_number": text.get("registration_number"),
+                "mark_text": text.get("mark_text"),
+                "owner_name": text.get("owner_name") or "Unknown",
+                "status": self._parse_status(text.get("status")),
+                "filing_date": self._parse_date(text.get("filing_date")),
+                "registration_date": self._parse_date(text.get("registration_date")),
+                "international_classes": classes,
+                "goods_services_description": text.get("goods_services_description"),
             }
 
-            return Trademark(**trademark_data)
+            if validate or trademark_data["serial_number"] is None or trademark_data["mark_text"] is None:
+                return Trademark(**trademark_data)
+            return Trademark.model_construct(**trademark_data)
 
         except Exception as e:
-            print(f"Error parsing TSDR XML: {e}")
+            logger.warning("Error parsing TSDR XML: %s", e)
             return None
 
-    def _get_xml_text(self, root: ET.Element, path: str, namespaces: dict = None) -> Optional[str]:
-        """Safely get text from XML element"""
-        element = root.find(path, namespaces=namespaces)
-        return element.text if element is not None else None
+    def _scan_tsdr(self, xml_bytes: bytes) -> tuple[Dict[str, Optional[str]], List[str]]:
+        """
+        Read TSDR fields and Nice classes in one streaming pass (lxml)
+
+        iterparse only surfaces the elements we read, in document order, so
+        the first occurrence of each field wins as with .find(). Each is
+        cleared once read, which also drops the bulk of every
+        GoodsServicesClassification subtree as soon as it is parsed.
 
-    def _get_classes(self, root: ET.Element, namespaces: dict = None) -> List[str]:
+        The pass always reaches the end of the document: classifications may
+        appear anywhere, and stopping early would let this path disagree
+        with the ElementTree fallback (_get_classes scans the whole tree).
+        """
+        text = {}
+        classes = []
+        for _, elem in etree.iterparse(BytesIO(xml_bytes), events=("end",), tag=_TSDR_TAGS):
+            tag = elem.tag
+            if tag == _TSDR_CLASSIFICATION_TAG:
+                kind_code = elem.find(_KIND_CODE_PATH)
+                if kind_code is not None and kind_code.text == "Nice":
+                    class_num = elem.find(_CLASS_NUMBER_PATH)
+                    if class_num is not None and class_num.text:
+                        classes.append(_format_class(class_num.text))
+            else:
+                text.setdefault(_TSDR_FIELD_BY_TAG[tag], elem.text)
+            elem.clear(keep_tail=True)
+        return text, classes
+
+    def _get_xml_texts(self, root: ET.Element) -> Dict[str, Optional[str]]:
+        """Text of every TSDR_PATHS field (None where the element is missing)"""
+        return {
+            field: getattr(root.find(path), "text", None)
+            for field, path in _TSDR_FIND_PATHS.items()
+        }
+
+    def _get_classes(self, root: ET.Element) -> List[str]:
         """Extract international classification codes (Nice Classification)"""
         classes = []
-        for class_elem in root.findall(".//ns2:GoodsServicesClassification", namespaces=namespaces):
-            kind_code = class_elem.find(".//ns2:ClassificationKindCode", namespaces=namespaces)
+        for class_elem in root.iterfind(_CLASSIFICATION_PATH):
+            kind_code = class_elem.find(_KIND_CODE_PATH)
             if kind_code is not None and kind_code.text == "Nice":
-                class_num = class_elem.find(".//ns2:ClassNumber", namespaces=namespaces)
+                class_num = class_elem.find(_CLASS_NUMBER_PATH)
                 if class_num is not None and class_num.text:
-                    classes.append(class_num.text.zfill(3))  # Pad to 3 digits
+                    classes.append(_format_class(class_num.text))
         return classes
 
     def _parse_status(self, status_code: Optional[str]) -> TrademarkStatus:
         """Map USPTO status code to TrademarkStatus enum"""
         if not status_code:
             return TrademarkStatus.UNKNOWN
+        return _TSDR_STATUS_MAP.get(status_code) or _TSDR_STATUS_MAP.get(status_code.upper(), TrademarkStatus.UNKNOWN)
 
-        status_map = {
-            "REGISTERED": TrademarkStatus.REGISTERED,
-            "NEW APPLICATION FILED": TrademarkStatus.PENDING,
-            "ABANDONED": TrademarkStatus.ABANDONED,
-            "CANCELLED": TrademarkStatus.CANCELLED,
-            "EXPIRED": TrademarkStatus.EXPIRED,
-        }
-
-        return status_map.get(status_code.upper(), TrademarkStatus.UNKNOWN)
-
-    def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
-        """Parse date string to datetime"""
+    def _parse_date(self, date_str: Optional[str]) -> Optional[date]:
+        """Parse date string to date"""
         if not date_str:
             return None
 
         try:
-            # Try multiple date formats
+            # Fast path for the ISO, compact and US forms USPTO sends: slice
+            # out the fields instead of running strptime's format machinery
+            # (and raising/catching ValueError for each format that misses)
+            n = len(date_str)
+            if n == 10 and date_str[4] == "-" == date_str[7]:
+                year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+            elif n == 10 and date_str[2] == "/" == date_str[5]:
+                year, month, day = date_str[6:], date_str[:2], date_str[3:5]
+            elif n == 8:
+                year, month, day = date_str[:4], date_str[4:6], date_str[6:]
+            else:
+                year = month = day = ""
+            if (year + month + day).isdecimal():
+                return date(int(year), int(month), int(day))
+
+            # Anything else (e.g. unpadded fields): try each format
             for fmt in ["%Y-%m-%d", "%Y%m%d", "%m/%d/%Y"]:
                 try:
                     return datetime.strptime(date_str, fmt).date()
@@ -0,0 +1,6 @@
+-- Trigram index for fuzzy mark_text search (used when ENABLE_TRIGRAM_SEARCH=true)
+-- Run once: PostgreSQLClient().execute_sql_file("migrations/001_trigram_search.sql")
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS trademarks_mark_text_trgm
+    ON trademarks USING gin (mark_text gin_trgm_ops);
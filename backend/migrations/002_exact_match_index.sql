@@ -0,0 +1,5 @@
+-- Expression index so search_exact_match (UPPER(mark_text) = UPPER($1))
+-- is an index lookup instead of a sequential scan
+-- Run once: PostgreSQLClient().execute_sql_file("migrations/002_exact_match_index.sql")
+CREATE INDEX IF NOT EXISTS idx_trademarks_mark_upper
+    ON trademarks (UPPER(mark_text));
@@ -0,0 +1,4 @@
+-- fuzzystrmatch (dmetaphone, levenshtein) for scoring search results
+-- in the database (used when ENABLE_DB_SIMILARITY=true)
+-- Run once: PostgreSQLClient().execute_sql_file("migrations/003_db_similarity.sql")
+CREATE EXTENSION IF NOT EXISTS fuzzystrmatch;